@@ -0,0 +1,223 @@
+"""Helpers shared by the benchmark scripts: seeding, timing and result files."""
+
+import argparse
+import json
+import math
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from datetime import timezone
+
+from sqlalchemy import delete
+from sqlalchemy import select
+
+from property.domain.enums import ConfigurationType
+from property.domain.models import Configuration
+from property.domain.models import Location
+from property.domain.models import Property
+from property.infrastructure.postgres.tables import ConfigurationTable
+from property.infrastructure.postgres.tables import PropertyTable
+
+
+PROPERTY_TYPE = "benchmark"
+
+CONFIGURATIONS = [
+    Configuration(key=PROPERTY_TYPE, type=ConfigurationType.TEXT),
+    Configuration(key="benchmark_area", type=ConfigurationType.NUMBER),
+    Configuration(
+        key="benchmark_view",
+        type=ConfigurationType.SELECT,
+        value=["sea", "city", "park"],
+    ),
+]
+
+CONFIGURATION_KEYS = [configuration.key for configuration in CONFIGURATIONS]
+
+VIEWS = ("sea", "city", "park")
+
+# Metrics where a larger value is a regression, the rest regress when smaller.
+LOWER_IS_BETTER = ("median_ms", "p95_ms", "p99_ms")
+
+
+def build_properties(count: int, start: int = 0) -> list[Property]:
+    return [
+        Property(
+            property_type=PROPERTY_TYPE,
+            room_count=index % 6 + 1,
+            bathroom_count=index % 3 + 1,
+            additional_features={
+                "benchmark_area": 40 + index % 200,
+                "benchmark_view": VIEWS[index % 3],
+            },
+            location=Location(
+                address=f"{index} benchmark avenue",
+                latitude=40 + index % 100 * 0.001,
+                longitude=-3 - index % 100 * 0.001,
+            ),
+            rent_value=500 + index % 1000,
+        )
+        for index in range(start, start + count)
+    ]
+
+
+async def seed(container, rows: int, batch_size: int = 10000) -> None:
+    configuration_repository = container.configuration_repository()
+    async with container.db_connection().get_session() as session:
+        existing = set(
+            (
+                await session.scalars(
+                    select(ConfigurationTable.key).where(
+                        ConfigurationTable.key.in_(CONFIGURATION_KEYS)
+                    )
+                )
+            ).all()
+        )
+    await configuration_repository.create_many(
+        [
+            configuration
+            for configuration in CONFIGURATIONS
+            if configuration.key not in existing
+        ]
+    )
+
+    property_repository = container.property_repository()
+    for start in range(0, rows, batch_size):
+        count = min(batch_size, rows - start)
+        await property_repository.copy_many(build_properties(count, start))
+        print(f"seeded {start + count}/{rows} properties", file=sys.stderr)
+
+
+async def seeded_ids(container, limit: int = 1000) -> list[str]:
+    async with container.db_connection().get_session() as session:
+        ids = await session.scalars(
+            select(PropertyTable.id)
+            .where(PropertyTable.property_type == PROPERTY_TYPE)
+            .limit(limit)
+        )
+        return [str(id) for id in ids.all()]
+
+
+async def configuration_ids(container) -> list[str]:
+    async with container.db_connection().get_session() as session:
+        ids = await session.scalars(
+            select(ConfigurationTable.id).where(
+                ConfigurationTable.key.in_(CONFIGURATION_KEYS)
+            )
+        )
+        return [str(id) for id in ids.all()]
+
+
+async def cleanup(container) -> None:
+    async with container.db_connection().get_session() as session:
+        await session.execute(
+            delete(PropertyTable).where(PropertyTable.property_type == PROPERTY_TYPE)
+        )
+        await session.execute(
+            delete(ConfigurationTable).where(
+                ConfigurationTable.key.in_(CONFIGURATION_KEYS)
+            )
+        )
+        await session.commit()
+
+
+def percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    index = max(math.ceil(q / 100 * len(ordered)) - 1, 0)
+    return ordered[index]
+
+
+def summarise(timings: list[float], elapsed: float | None = None, **extra) -> dict:
+    summary = {
+        "count": len(timings),
+        "median_ms": round(statistics.median(timings), 4),
+        "p95_ms": round(percentile(timings, 95), 4),
+        "p99_ms": round(percentile(timings, 99), 4),
+        "min_ms": round(min(timings), 4),
+        "max_ms": round(max(timings), 4),
+    }
+    if elapsed is not None:
+        summary["ops_per_second"] = round(len(timings) / elapsed, 2)
+    summary.update(extra)
+    return summary
+
+
+def measure(callback, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        callback()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def add_result_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--output", help="Write the results as JSON to this file")
+    parser.add_argument(
+        "--baseline", help="Fail when the results regress from this JSON file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression against the baseline (default 0.2)",
+    )
+
+
+def find_regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, metrics in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for metric, value in metrics.items():
+            reference = expected.get(metric)
+            if not isinstance(reference, (int, float)) or not reference:
+                continue
+            if metric in LOWER_IS_BETTER:
+                regressed = value > reference * (1 + tolerance)
+            elif metric == "ops_per_second":
+                regressed = value < reference * (1 - tolerance)
+            elif metric == "errors":
+                regressed = value > reference
+            else:
+                continue
+            if regressed:
+                regressions.append(f"{name}.{metric}: {value} (baseline {reference})")
+    return regressions
+
+
+def report(
+    args: argparse.Namespace, suite: str, parameters: dict, results: dict
+) -> int:
+    for name, metrics in results.items():
+        line = (
+            f"{name:<34} median {metrics['median_ms']:10.4f} ms"
+            f"  p95 {metrics['p95_ms']:10.4f} ms"
+        )
+        if "ops_per_second" in metrics:
+            line += f"  {metrics['ops_per_second']:10.2f} ops/s"
+        if metrics.get("errors"):
+            line += f"  {metrics['errors']} errors"
+        print(line)
+
+    document = {
+        "suite": suite,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "parameters": parameters,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(document, file, indent=2)
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    regressions = find_regressions(results, baseline["results"], args.tolerance)
+    for regression in regressions:
+        print(f"regression: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
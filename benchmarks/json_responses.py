@@ -0,0 +1,75 @@
+"""Compare the default FastAPI JSON encoding with the fast JSON response path.
+
+Builds ``--rows`` property outputs in memory, so no database is needed::
+
+    uv run python -m benchmarks.json_responses --rows 1000 --repeat 50
+"""
+
+import argparse
+import statistics
+import sys
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from benchmarks.common import add_result_arguments
+from benchmarks.common import measure
+from benchmarks.common import report
+from benchmarks.common import summarise
+from property.application.dtos import LocationOutput
+from property.application.dtos import PropertyOutput
+from property.presentation.property_api import property_list_adapter
+from property.presentation.responses import render
+
+
+def build_outputs(count: int) -> list[PropertyOutput]:
+    return [
+        PropertyOutput(
+            id=str(uuid4()),
+            property_type="apartment",
+            room_count=index % 6 + 1,
+            bathroom_count=index % 3 + 1,
+            additional_features={"area": 40 + index % 200, "pool": index % 2 == 0},
+            location=LocationOutput(
+                address=f"{index} benchmark avenue",
+                latitude=40 + index % 100 * 0.001,
+                longitude=-3 - index % 100 * 0.001,
+            ),
+            rent_value=500 + index % 1000,
+        )
+        for index in range(count)
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.json_responses")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    add_result_arguments(parser)
+    args = parser.parse_args(argv)
+    outputs = build_outputs(args.rows)
+
+    def default():
+        return JSONResponse(jsonable_encoder(outputs)).body
+
+    def fast():
+        return render(outputs, property_list_adapter, True).body
+
+    results = {
+        "default": measure(default, args.repeat),
+        "fast": measure(fast, args.repeat),
+    }
+    exit_code = report(
+        args,
+        "json_responses",
+        {"rows": args.rows, "repeat": args.repeat},
+        {name: summarise(timings) for name, timings in results.items()},
+    )
+    speedup = statistics.median(results["default"]) / statistics.median(results["fast"])
+    print(f"speedup: {speedup:.2f}x")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Compare the entity based list path with the row projection path.
+
+Seeds ``--rows`` properties tagged with a dedicated property type, times both
+paths over the same page and removes the seeded rows afterwards::
+
+    uv run python -m benchmarks.list_projection --rows 1000 --repeat 20
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from sqlalchemy import delete
+
+from benchmarks.common import PROPERTY_TYPE
+from benchmarks.common import add_result_arguments
+from benchmarks.common import build_properties
+from benchmarks.common import report
+from benchmarks.common import summarise
+from property.application.mappers import PropertyMapper
+from property.domain.filters import PropertyFilter
+from property.infrastructure.postgres.tables import PropertyTable
+from property.settings import create_container
+
+
+async def measure(callback, repeat: int) -> list[float]:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await callback()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+async def run(args: argparse.Namespace) -> int:
+    container = create_container()
+    repository = container.property_repository()
+    db_connection = container.db_connection()
+    mapper = PropertyMapper()
+    filters = PropertyFilter(property_type_eq=PROPERTY_TYPE, size=args.rows)
+
+    async def entities():
+        page = await repository.list_page(filters)
+        return [mapper.to_api(entity) for entity in page.items]
+
+    async def rows():
+        page = await repository.list_rows(filters)
+        return [mapper.row_to_api(row) for row in page.items]
+
+    try:
+        await repository.copy_many(build_properties(args.rows))
+        # Warm both paths so connection setup is not measured.
+        await entities()
+        await rows()
+        results = {
+            "entities": await measure(entities, args.repeat),
+            "rows": await measure(rows, args.repeat),
+        }
+    finally:
+        async with db_connection.get_session() as session:
+            await session.execute(
+                delete(PropertyTable).where(
+                    PropertyTable.property_type == PROPERTY_TYPE
+                )
+            )
+            await session.commit()
+        await db_connection.close()
+
+    exit_code = report(
+        args,
+        "list_projection",
+        {"rows": args.rows, "repeat": args.repeat},
+        {name: summarise(timings) for name, timings in results.items()},
+    )
+    speedup = statistics.median(results["entities"]) / statistics.median(
+        results["rows"]
+    )
+    print(f"speedup: {speedup:.2f}x")
+    return exit_code
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.list_projection")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    add_result_arguments(parser)
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""Drive the API with concurrent clients and record latency and throughput.
+
+Seeds ``--rows`` properties tagged with a dedicated property type, runs every
+scenario with ``--concurrency`` clients and removes the seeded rows afterwards.
+By default the ASGI app runs in-process; pass ``--base-url`` to benchmark a
+server started separately against the same ``DATABASE_URL``::
+
+    uv run python -m benchmarks.load --rows 10000 --requests 1000 --concurrency 32
+    uv run python -m benchmarks.load --base-url http://localhost:8000 \\
+        --output results.json --baseline baseline.json
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from httpx import ASGITransport
+from httpx import AsyncClient
+from httpx import Limits
+
+from benchmarks.common import PROPERTY_TYPE
+from benchmarks.common import VIEWS
+from benchmarks.common import add_result_arguments
+from benchmarks.common import cleanup
+from benchmarks.common import configuration_ids
+from benchmarks.common import report
+from benchmarks.common import seed
+from benchmarks.common import seeded_ids
+from benchmarks.common import summarise
+from property.settings import create_container
+
+
+PROPERTIES_URL = "/api/properties/"
+CONFIGURATIONS_URL = "/api/properties/settings/"
+
+
+def create_payload(index: int) -> dict:
+    return {
+        "property_type": PROPERTY_TYPE,
+        "room_count": index % 6 + 1,
+        "bathroom_count": index % 3 + 1,
+        "additional_features": {
+            "benchmark_area": 40 + index % 200,
+            "benchmark_view": VIEWS[index % 3],
+        },
+        "location": {
+            "address": f"{index} load avenue",
+            "latitude": 40.0,
+            "longitude": -3.0,
+        },
+        "rent_value": 500 + index % 1000,
+    }
+
+
+class Scenarios:
+    def __init__(self, property_ids: list[str], configuration_ids: list[str]):
+        self.property_ids = property_ids
+        self.configuration_ids = configuration_ids
+        self.created_ids: list[str] = []
+
+    async def create(self, client: AsyncClient, index: int) -> bool:
+        response = await client.post(PROPERTIES_URL, json=create_payload(index))
+        if response.status_code != 201:
+            return False
+        self.created_ids.append(response.json()["id"])
+        return True
+
+    async def get(self, client: AsyncClient, index: int) -> bool:
+        property_id = self.property_ids[index % len(self.property_ids)]
+        response = await client.get(f"{PROPERTIES_URL}{property_id}")
+        return response.status_code == 200
+
+    async def list(self, client: AsyncClient, index: int) -> bool:
+        response = await client.get(
+            PROPERTIES_URL,
+            params={
+                "property_type_eq": PROPERTY_TYPE,
+                "room_count_gte": index % 6 + 1,
+                "size": 50,
+            },
+        )
+        return response.status_code == 200
+
+    async def update(self, client: AsyncClient, index: int) -> bool:
+        # Spread updates apart from the rows the get scenario reads.
+        property_id = self.property_ids[-1 - index % len(self.property_ids)]
+        response = await client.put(
+            f"{PROPERTIES_URL}{property_id}", json={"rent_value": 500 + index % 1000}
+        )
+        return response.status_code == 200
+
+    async def delete(self, client: AsyncClient, index: int) -> bool:
+        if not self.created_ids:
+            return False
+        response = await client.delete(f"{PROPERTIES_URL}{self.created_ids.pop()}")
+        return response.status_code == 204
+
+    async def configuration_list(self, client: AsyncClient, index: int) -> bool:
+        response = await client.get(CONFIGURATIONS_URL)
+        return response.status_code == 200
+
+    async def configuration_get(self, client: AsyncClient, index: int) -> bool:
+        configuration_id = self.configuration_ids[index % len(self.configuration_ids)]
+        response = await client.get(f"{CONFIGURATIONS_URL}{configuration_id}")
+        return response.status_code == 200
+
+
+# Deletes run last so they remove the rows the create scenario wrote.
+SCENARIOS = (
+    "create",
+    "get",
+    "list",
+    "update",
+    "configuration_list",
+    "configuration_get",
+    "delete",
+)
+
+
+async def run_scenario(
+    client: AsyncClient, request, requests: int, concurrency: int
+) -> dict:
+    timings: list[float] = []
+    errors = 0
+    indexes = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for index in indexes:
+            start = time.perf_counter()
+            try:
+                ok = await request(client, index)
+            except Exception:
+                ok = False
+            timings.append((time.perf_counter() - start) * 1000)
+            errors += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarise(timings, time.perf_counter() - start, errors=errors)
+
+
+@asynccontextmanager
+async def create_client(args: argparse.Namespace) -> AsyncIterator[AsyncClient]:
+    if args.base_url:
+        limits = Limits(max_connections=args.concurrency)
+        async with AsyncClient(
+            base_url=args.base_url, limits=limits, timeout=60
+        ) as client:
+            yield client
+        return
+
+    from main import app
+
+    # Run the app lifespan so pools are warmed and closed as in a real server.
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://benchmark", timeout=60
+        ) as client:
+            yield client
+
+
+async def run(args: argparse.Namespace) -> int:
+    container = create_container()
+    db_connection = container.db_connection()
+    scenarios = [name for name in SCENARIOS if name in args.scenarios]
+    results = {}
+    try:
+        if not args.skip_seed:
+            await seed(container, args.rows)
+        workload = Scenarios(
+            await seeded_ids(container), await configuration_ids(container)
+        )
+        async with create_client(args) as client:
+            # Warm the pools and caches so connection setup is not measured.
+            await run_scenario(client, workload.get, args.concurrency, args.concurrency)
+            for name in scenarios:
+                results[name] = await run_scenario(
+                    client, getattr(workload, name), args.requests, args.concurrency
+                )
+    finally:
+        if not args.keep:
+            await cleanup(container)
+        await db_connection.close()
+
+    parameters = {
+        "rows": args.rows,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "transport": "http" if args.base_url else "asgi",
+    }
+    return report(args, "load", parameters, results)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--base-url", help="Benchmark a running server over HTTP")
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument(
+        "--skip-seed", action="store_true", help="Reuse rows seeded by --keep"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the seeded rows afterwards"
+    )
+    add_result_arguments(parser)
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Micro-benchmark the mappers and the configuration validation.
+
+Everything runs in memory, so no database is needed. Each result is the time
+of ``--iterations`` calls, measured ``--repeat`` times::
+
+    uv run python -m benchmarks.micro --iterations 1000 --repeat 20 \\
+        --output micro.json --baseline micro-baseline.json
+"""
+
+import argparse
+import sys
+from uuid import uuid4
+
+from benchmarks.common import CONFIGURATIONS
+from benchmarks.common import add_result_arguments
+from benchmarks.common import build_properties
+from benchmarks.common import measure
+from benchmarks.common import report
+from benchmarks.common import summarise
+from property.application.dtos import PropertyUpdateRequest
+from property.application.mappers import PropertyMapper
+from property.domain.validators import ConfigurationValidator
+from property.infrastructure.postgres.mappers import (
+    PropertyMapper as PropertyTableMapper,
+)
+
+
+def build_row(entity) -> dict:
+    values = PropertyTableMapper().to_values(entity)
+    values["id"] = uuid4()
+    return values
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.micro")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    add_result_arguments(parser)
+    args = parser.parse_args(argv)
+
+    mapper = PropertyMapper()
+    table_mapper = PropertyTableMapper()
+    entities = build_properties(args.iterations)
+    for entity in entities:
+        entity.id = uuid4()
+    outputs = [mapper.to_api(entity) for entity in entities]
+    # Values read from a CSV file are always strings.
+    csv_rows = [
+        dict(zip(mapper.csv_columns, map(str, mapper.to_csv_row(output))))
+        for output in outputs
+    ]
+    create_requests = [mapper.from_csv_row(row) for row in csv_rows]
+    rows = [build_row(entity) for entity in entities]
+    update_request = PropertyUpdateRequest(room_count=3, rent_value=900)
+    validator = ConfigurationValidator(CONFIGURATIONS)
+
+    cases = {
+        "mapper.to_domain": lambda: [mapper.to_domain(r) for r in create_requests],
+        "mapper.to_api": lambda: [mapper.to_api(entity) for entity in entities],
+        "mapper.row_to_api": lambda: [mapper.row_to_api(row) for row in rows],
+        "mapper.from_csv_row": lambda: [mapper.from_csv_row(row) for row in csv_rows],
+        "mapper.to_changes": lambda: [
+            mapper.to_changes(update_request) for _ in range(args.iterations)
+        ],
+        "table_mapper.to_values": lambda: [
+            table_mapper.to_values(entity) for entity in entities
+        ],
+        "validator.additional_features": lambda: [
+            entity.is_valid_additional_features(validator) for entity in entities
+        ],
+        # Passing the configurations builds a validator on every call.
+        "validator.additional_features_list": lambda: [
+            entity.is_valid_additional_features(CONFIGURATIONS) for entity in entities
+        ],
+    }
+
+    results = {}
+    for name, callback in cases.items():
+        callback()
+        results[name] = summarise(measure(callback, args.repeat))
+
+    parameters = {"iterations": args.iterations, "repeat": args.repeat}
+    return report(args, "micro", parameters, results)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,36 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from property.presentation.pagination import NEXT_CURSOR_HEADER
 from property.presentation.routes import router
 from property.settings import create_container
 from property.application.exceptions import ExceptionResponse
 from property.domain.exceptions import BaseException
 
 
-app = FastAPI(title="Property Management API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    db_connection = app.container.db_connection()
+    configuration_listener = app.container.configuration_listener()
+    property_listener = app.container.property_listener()
+    write_buffer = app.container.property_write_buffer()
+    await db_connection.warm_up()
+    db_connection.start_health_checks()
+    await configuration_listener.start()
+    if property_listener is not None:
+        await property_listener.start()
+    yield
+    await write_buffer.close()
+    if property_listener is not None:
+        await property_listener.stop()
+    await configuration_listener.stop()
+    await db_connection.close()
+
+
+app = FastAPI(title="Property Management API", lifespan=lifespan)
 app.include_router(router)
 app.add_middleware(
     CORSMiddleware,
@@ -16,6 +38,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Last-Modified"],
 )
 
 
@@ -0,0 +1,61 @@
+"""additional features jsonb
+
+Revision ID: 4c1f0a8e6d23
+Revises: b7e2c91d4f10
+Create Date: 2026-10-18 18:02:47.503190
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4c1f0a8e6d23"
+down_revision: Union[str, Sequence[str], None] = "b7e2c91d4f10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "property",
+        "additional_features",
+        existing_type=postgresql.JSON(astext_type=sa.Text()),
+        type_=postgresql.JSONB(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="additional_features::jsonb",
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_property_additional_features",
+            "property",
+            ["additional_features"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_property_additional_features",
+            table_name="property",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.alter_column(
+        "property",
+        "additional_features",
+        existing_type=postgresql.JSONB(astext_type=sa.Text()),
+        type_=postgresql.JSON(astext_type=sa.Text()),
+        existing_nullable=False,
+        postgresql_using="additional_features::json",
+    )
@@ -0,0 +1,76 @@
+"""add property address search
+
+Revision ID: 9d3b6f2a7c14
+Revises: e5a9d7c3b281
+Create Date: 2026-10-18 19:02:44.517208
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3b6f2a7c14"
+down_revision: Union[str, Sequence[str], None] = "e5a9d7c3b281"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        "property",
+        sa.Column(
+            "location_search",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('simple', coalesce(location_address, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_property_location_search",
+            "property",
+            ["location_search"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # Serves the substring ILIKE and word similarity (%>) address search.
+        op.create_index(
+            "ix_property_location_address_trgm",
+            "property",
+            ["location_address"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"location_address": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_property_location_address_trgm",
+            table_name="property",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_property_location_search",
+            table_name="property",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("property", "location_search")
@@ -0,0 +1,54 @@
+"""add property search indexes
+
+Revision ID: b7e2c91d4f10
+Revises: 3a4847653d4e
+Create Date: 2026-10-18 17:40:12.118342
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2c91d4f10"
+down_revision: Union[str, Sequence[str], None] = "3a4847653d4e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = {
+    "ix_property_property_type_rent_value": ["property_type", "rent_value"],
+    "ix_property_rent_value_id": ["rent_value", "id"],
+    "ix_property_room_count_bathroom_count": ["room_count", "bathroom_count"],
+    "ix_property_updated_at_id": ["updated_at", "id"],
+    "ix_property_created_at_id": ["created_at", "id"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Built concurrently so writes to a large property table are not blocked.
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES.items():
+            op.create_index(
+                name,
+                "property",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name in INDEXES:
+            op.drop_index(
+                name,
+                table_name="property",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
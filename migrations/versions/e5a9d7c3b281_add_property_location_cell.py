@@ -0,0 +1,71 @@
+"""add property location cell
+
+Revision ID: e5a9d7c3b281
+Revises: 4c1f0a8e6d23
+Create Date: 2026-10-18 18:31:05.884127
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a9d7c3b281"
+down_revision: Union[str, Sequence[str], None] = "4c1f0a8e6d23"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "property",
+        sa.Column(
+            "location_cell",
+            sa.Integer(),
+            sa.Computed(
+                "(floor(location_latitude * 10)::int + 900) * 3600"
+                " + (floor(location_longitude * 10)::int + 1800)",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_property_location_cell",
+            "property",
+            ["location_cell"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_property_location_latitude_longitude",
+            "property",
+            ["location_latitude", "location_longitude"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_property_location_latitude_longitude",
+            table_name="property",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_property_location_cell",
+            table_name="property",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("property", "location_cell")
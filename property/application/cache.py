@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+from property.domain.filters import ConfigurationFilter
+from property.domain.interfaces import IConfigurationRepository
+from property.domain.models import Configuration
+from property.domain.validators import ConfigurationValidator
+
+
+class ConfigurationCache:
+    def __init__(
+        self,
+        configuration_repository: IConfigurationRepository,
+        ttl: float = 60,
+    ):
+        self.configuration_repository = configuration_repository
+        self.ttl = ttl
+        self._configurations: dict[str, Configuration] | None = None
+        self._validator: ConfigurationValidator | None = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def _is_fresh(self) -> bool:
+        return self._configurations is not None and time.monotonic() < self._expires_at
+
+    async def get_all(self) -> dict[str, Configuration]:
+        configurations, _ = await self._get()
+        return configurations
+
+    async def get_validator(self) -> ConfigurationValidator:
+        _, validator = await self._get()
+        return validator
+
+    async def _get(self) -> tuple[dict[str, Configuration], ConfigurationValidator]:
+        if self._is_fresh():
+            return self._configurations, self._validator
+        async with self._lock:
+            if self._is_fresh():
+                return self._configurations, self._validator
+            return await self._load()
+
+    async def _load(self) -> tuple[dict[str, Configuration], ConfigurationValidator]:
+        generation = self._generation
+        # Reloads follow writes, a lagging replica would pin the old set.
+        entities = await self.configuration_repository.list(
+            ConfigurationFilter(), primary=True
+        )
+        configurations = {entity.key: entity for entity in entities}
+        validator = ConfigurationValidator(entities)
+        # A write that happened while loading makes this snapshot stale.
+        if generation == self._generation:
+            self._configurations = configurations
+            self._validator = validator
+            self._expires_at = time.monotonic() + self.ttl
+        return configurations, validator
+
+    def invalidate(self, key: str | None = None) -> None:
+        # Every configuration is reloaded, whichever key changed.
+        self._generation += 1
+        self._configurations = None
+        self._validator = None
@@ -0,0 +1,73 @@
+import asyncio
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+
+from pydantic import BaseModel
+
+
+class SingleFlightStatistics(BaseModel):
+    enabled: bool = True
+    executed: int = 0
+    coalesced: int = 0
+    in_flight: int = 0
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+class SingleFlight:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.executed = 0
+        self.coalesced = 0
+        self._calls: dict[str, asyncio.Future] = {}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.enabled:
+            return await loader()
+
+        future = self._calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+        while future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Only the caller that ran the query was cancelled, retry it.
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+            future = self._calls.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_retrieve_exception)
+        self._calls[key] = future
+        self.executed += 1
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def forget(self) -> None:
+        # Callers arriving after a write must not join a query started before it.
+        self._calls.clear()
+
+    def stats(self) -> SingleFlightStatistics:
+        return SingleFlightStatistics(
+            enabled=self.enabled,
+            executed=self.executed,
+            coalesced=self.coalesced,
+            in_flight=len(self._calls),
+        )
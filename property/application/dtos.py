@@ -1,6 +1,13 @@
+from datetime import datetime
+
+from uuid import UUID
+
 from pydantic import BaseModel
+from pydantic import Field
 
 from property.domain.enums import ConfigurationType
+from property.domain.enums import ExportFormat
+from property.domain.enums import ImportStatus
 
 
 class BaseCreateRequest(BaseModel):
@@ -55,6 +62,38 @@ class PropertyOutput(BaseOutput):
     rent_value: float
 
 
+class PropertyBatchGetRequest(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=1000)
+
+
+class PropertyBatchGetOutput(BaseOutput):
+    items: list[PropertyOutput]
+    missing: list[str]
+
+
+class PropertyBulkErrorOutput(BaseOutput):
+    index: int
+    status_code: int
+    message: str
+
+
+class PropertyBulkOutput(BaseOutput):
+    created: list[PropertyOutput]
+    errors: list[PropertyBulkErrorOutput]
+
+
+class PropertyImportOutput(BaseOutput):
+    id: str
+    format: ExportFormat
+    status: ImportStatus
+    processed: int = 0
+    created: int = 0
+    failed: int = 0
+    errors_url: str | None = None
+    started_at: datetime
+    finished_at: datetime | None = None
+
+
 class ConfigurationOutput(BaseOutput):
     id: str
     key: str
@@ -0,0 +1,134 @@
+import asyncio
+import contextvars
+import logging
+
+from pydantic import BaseModel
+
+from property.domain.interfaces import IBaseRepository
+from property.domain.models import BaseEntity
+
+
+logger = logging.getLogger(__name__)
+
+
+class GroupCommitStatistics(BaseModel):
+    enabled: bool = True
+    writes: int = 0
+    batches: int = 0
+    fallbacks: int = 0
+    largest_batch: int = 0
+    pending: int = 0
+
+
+def _retrieve_exception(future: asyncio.Future) -> None:
+    if not future.cancelled():
+        future.exception()
+
+
+class GroupCommitBuffer:
+    def __init__(
+        self,
+        repository: IBaseRepository,
+        enabled: bool = False,
+        max_delay: float = 0.01,
+        max_batch_size: int = 100,
+    ):
+        self.repository = repository
+        self.enabled = enabled
+        self.max_delay = max_delay
+        self.max_batch_size = max_batch_size
+        self.writes = 0
+        self.batches = 0
+        self.fallbacks = 0
+        self.largest_batch = 0
+        self._pending: list[tuple[BaseEntity, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def create(self, entity: BaseEntity) -> BaseEntity:
+        if not self.enabled:
+            return await self._create(entity)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        future.add_done_callback(_retrieve_exception)
+        self._pending.append((entity, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            # Flushes run in an empty context so they never join the caller's
+            # unit of work and commit on their own.
+            self._timer = loop.call_later(
+                self.max_delay, self._flush, context=contextvars.Context()
+            )
+        # A cancelled caller does not take its row out of a batch.
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.get_running_loop().create_task(
+            self._write(batch), context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write(self, batch: list[tuple[BaseEntity, asyncio.Future]]) -> None:
+        self.batches += 1
+        self.writes += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        try:
+            await self._write_batch(batch)
+        finally:
+            for _, future in batch:
+                future.cancel()
+
+    async def _write_batch(
+        self, batch: list[tuple[BaseEntity, asyncio.Future]]
+    ) -> None:
+        try:
+            created = await self.repository.create_many([entity for entity, _ in batch])
+        except Exception as e:
+            # One bad row fails the whole statement, write the rows one by one
+            # so each caller gets its own result.
+            logger.warning("Group commit of %s rows failed: %s", len(batch), e)
+            self.fallbacks += 1
+            for entity, future in batch:
+                try:
+                    result = await self._create(entity)
+                except Exception as error:
+                    if not future.done():
+                        future.set_exception(error)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            return
+        for (_, future), result in zip(batch, created):
+            if not future.done():
+                future.set_result(result)
+
+    async def _create(self, entity: BaseEntity) -> BaseEntity:
+        # Rows the database rejects fail as they do in a bulk create.
+        [result] = await self.repository.create_each([entity])
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def close(self) -> None:
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def stats(self) -> GroupCommitStatistics:
+        return GroupCommitStatistics(
+            enabled=self.enabled,
+            writes=self.writes,
+            batches=self.batches,
+            fallbacks=self.fallbacks,
+            largest_batch=self.largest_batch,
+            pending=len(self._pending),
+        )
@@ -0,0 +1,274 @@
+import codecs
+import csv
+import glob
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from datetime import timezone
+from typing import AsyncIterator
+from typing import Callable
+from typing import TextIO
+from uuid import uuid4
+
+from pydantic import ValidationError
+
+from property.application.cache import ConfigurationCache
+from property.application.dtos import PropertyCreateRequest
+from property.application.dtos import PropertyImportOutput
+from property.application.mappers import PropertyMapper
+from property.application.response_cache import ResponseCache
+from property.domain.enums import ExportFormat
+from property.domain.enums import ImportStatus
+from property.domain.exceptions import BaseException
+from property.domain.exceptions import ImportNotFoundError
+from property.domain.interfaces import IPropertyRepository
+from property.domain.models import Property
+
+
+logger = logging.getLogger(__name__)
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in detail['loc'])}: {detail['msg']}"
+            for detail in error.errors()
+        )
+    if isinstance(error, BaseException):
+        return error.message
+    return str(error)
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+class _ErrorFile:
+    def __init__(self, path: str):
+        self.path = path
+        self.file: TextIO | None = None
+
+    def write(self, line: int, message: str) -> None:
+        if self.file is None:
+            self.file = open(self.path, "w", encoding="utf-8")
+        self.file.write(json.dumps({"line": line, "message": message}) + "\n")
+
+    def flush(self) -> None:
+        if self.file is not None:
+            self.file.flush()
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+
+
+class PropertyImporter:
+    def __init__(
+        self,
+        property_repository: IPropertyRepository,
+        configuration_cache: ConfigurationCache,
+        batch_size: int = 1000,
+        imports_dir: str | None = None,
+        max_imports: int = 100,
+        response_cache: ResponseCache | None = None,
+    ):
+        self.property_repository = property_repository
+        self.configuration_cache = configuration_cache
+        self.batch_size = batch_size
+        # Reports and error files live in this directory, so every worker that
+        # shares it can serve them.
+        self.imports_dir = imports_dir or tempfile.gettempdir()
+        self.max_imports = max_imports
+        self.response_cache = response_cache
+        self.mapper = PropertyMapper()
+
+    def _report_path(self, id: str) -> str:
+        return os.path.join(self.imports_dir, f"import-{id}.json")
+
+    def _errors_path(self, id: str) -> str:
+        return os.path.join(self.imports_dir, f"import-{id}-errors.ndjson")
+
+    def list_imports(self) -> list[PropertyImportOutput]:
+        reports = []
+        for path in glob.glob(os.path.join(self.imports_dir, "import-*.json")):
+            try:
+                with open(path, encoding="utf-8") as file:
+                    reports.append(
+                        PropertyImportOutput.model_validate_json(file.read())
+                    )
+            except (OSError, ValidationError):
+                # Removed or being replaced by another worker.
+                continue
+        return sorted(reports, key=lambda report: report.started_at, reverse=True)
+
+    def get_import(self, id: str) -> PropertyImportOutput:
+        try:
+            with open(self._report_path(id), encoding="utf-8") as file:
+                return PropertyImportOutput.model_validate_json(file.read())
+        except FileNotFoundError:
+            raise ImportNotFoundError(id)
+
+    def get_import_errors(self, id: str) -> str | None:
+        self.get_import(id)
+        path = self._errors_path(id)
+        return path if os.path.exists(path) else None
+
+    def _save(self, report: PropertyImportOutput) -> None:
+        path = self._report_path(report.id)
+        # Readers never see a partly written report.
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            file.write(report.model_dump_json())
+        os.replace(f"{path}.tmp", path)
+
+    def _register(self, report: PropertyImportOutput) -> None:
+        self._save(report)
+        for old_report in self.list_imports()[self.max_imports :]:
+            for path in (
+                self._report_path(old_report.id),
+                self._errors_path(old_report.id),
+            ):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+    async def _records(
+        self, chunks: AsyncIterator[bytes], format: ExportFormat
+    ) -> AsyncIterator[tuple[int, PropertyCreateRequest | Exception]]:
+        lines = iter_lines(chunks)
+        if format == ExportFormat.NDJSON:
+            line_number = 0
+            async for line in lines:
+                line_number += 1
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, PropertyCreateRequest.model_validate_json(line)
+                except ValidationError as e:
+                    yield line_number, e
+            return
+
+        header = None
+        record = ""
+        line_number = start = 0
+        async for line in lines:
+            line_number += 1
+            if not record and not line.strip():
+                continue
+            if not record:
+                start = line_number
+            record = f"{record}\n{line}" if record else line
+            # An odd number of quotes means a quoted field spans several lines.
+            if record.count('"') % 2:
+                continue
+            values = next(csv.reader([record]))
+            record = ""
+            if header is None:
+                header = values
+                continue
+            if len(values) != len(header):
+                yield (
+                    start,
+                    ValueError(f"Expected {len(header)} columns, found {len(values)}"),
+                )
+                continue
+            try:
+                yield start, self.mapper.from_csv_row(dict(zip(header, values)))
+            except ValueError as e:
+                yield start, e
+        if record:
+            yield start, ValueError("Unterminated quoted field")
+
+    async def _validate(self, create_request: PropertyCreateRequest) -> Property:
+        validator = await self.configuration_cache.get_validator()
+        entity = self.mapper.to_domain(create_request)
+        entity.is_valid_property_type(validator)
+        entity.is_valid_additional_features(validator)
+        return entity
+
+    async def _flush(
+        self,
+        batch: list[tuple[int, Property]],
+        report: PropertyImportOutput,
+        errors: _ErrorFile,
+    ) -> None:
+        if not batch:
+            return
+        try:
+            report.created += await self.property_repository.copy_many(
+                [entity for _, entity in batch]
+            )
+        except Exception as e:
+            if len(batch) == 1:
+                line_number, _ = batch[0]
+                report.failed += 1
+                errors.write(line_number, _describe(e))
+                return
+            # One bad row fails the whole COPY, split the batch to isolate it.
+            logger.warning(
+                "Import %s failed to write %s rows: %s", report.id, len(batch), e
+            )
+            middle = len(batch) // 2
+            await self._flush(batch[:middle], report, errors)
+            await self._flush(batch[middle:], report, errors)
+            return
+        if self.response_cache is not None:
+            await self.response_cache.invalidate()
+
+    async def import_properties(
+        self,
+        chunks: AsyncIterator[bytes],
+        format: ExportFormat,
+        on_progress: Callable[[PropertyImportOutput], None] | None = None,
+    ) -> PropertyImportOutput:
+        report = PropertyImportOutput(
+            id=str(uuid4()),
+            format=format,
+            status=ImportStatus.RUNNING,
+            started_at=datetime.now(timezone.utc),
+        )
+        self._register(report)
+        errors = _ErrorFile(self._errors_path(report.id))
+        batch: list[tuple[int, Property]] = []
+        try:
+            async for line_number, record in self._records(chunks, format):
+                report.processed += 1
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+                    batch.append((line_number, await self._validate(record)))
+                except (BaseException, ValueError) as e:
+                    report.failed += 1
+                    errors.write(line_number, _describe(e))
+
+                # Awaiting the write before reading on is what bounds memory.
+                if len(batch) >= self.batch_size:
+                    await self._flush(batch, report, errors)
+                    batch = []
+                    errors.flush()
+                    self._save(report)
+                    if on_progress:
+                        on_progress(report)
+            await self._flush(batch, report, errors)
+            report.status = ImportStatus.COMPLETED
+        except Exception:
+            report.status = ImportStatus.FAILED
+            raise
+        finally:
+            errors.close()
+            report.finished_at = datetime.now(timezone.utc)
+            self._save(report)
+            if on_progress:
+                on_progress(report)
+        return report
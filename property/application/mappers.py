@@ -1,3 +1,10 @@
+import json
+from typing import Mapping
+from typing import TypeVar
+
+from pydantic import BaseModel
+from pydantic import TypeAdapter
+
 from property.domain.models import Configuration
 from property.domain.models import Property
 from property.domain.models import Location
@@ -7,10 +14,41 @@ from property.application.dtos import ConfigurationCreateRequest
 from property.application.dtos import PropertyUpdateRequest
 from property.application.dtos import PropertyCreateRequest
 from property.application.dtos import PropertyOutput
+from property.application.dtos import LocationCreateRequest
 from property.application.dtos import LocationOutput
 
 
+OutputT = TypeVar("OutputT", bound=BaseModel)
+
+_field_adapters: dict[tuple[type[BaseModel], str], TypeAdapter] = {}
+
+
+def partial_output(model: type[OutputT], values: dict) -> OutputT:
+    # Each selected value is validated on its own; the fields left out stay
+    # unset and are not serialised.
+    validated = {}
+    for name, value in values.items():
+        adapter = _field_adapters.get((model, name))
+        if adapter is None:
+            adapter = TypeAdapter(model.model_fields[name].annotation)
+            _field_adapters[(model, name)] = adapter
+        validated[name] = adapter.validate_python(value)
+    return model.model_construct(**validated)
+
+
 class PropertyMapper:
+    csv_columns = [
+        "id",
+        "property_type",
+        "room_count",
+        "bathroom_count",
+        "rent_value",
+        "location_address",
+        "location_latitude",
+        "location_longitude",
+        "additional_features",
+    ]
+
     def to_api(self, entity: Property) -> PropertyOutput:
         return PropertyOutput(
             id=str(entity.id),
@@ -26,6 +64,66 @@ class PropertyMapper:
             rent_value=entity.rent_value,
         )
 
+    def row_to_api(
+        self, row: Mapping, fields: list[str] | None = None
+    ) -> PropertyOutput:
+        if fields is not None:
+            return self.row_to_partial_api(row, fields)
+        return PropertyOutput.model_validate(
+            {
+                "id": str(row["id"]),
+                "property_type": row["property_type"],
+                "room_count": row["room_count"],
+                "bathroom_count": row["bathroom_count"],
+                "additional_features": row["additional_features"],
+                "location": self._row_location(row),
+                "rent_value": row["rent_value"],
+            }
+        )
+
+    def row_to_partial_api(self, row: Mapping, fields: list[str]) -> PropertyOutput:
+        values = {"id": str(row["id"])}
+        for field in fields:
+            if field == "location":
+                values[field] = self._row_location(row)
+            elif field != "id":
+                values[field] = row[field]
+        return partial_output(PropertyOutput, values)
+
+    def _row_location(self, row: Mapping) -> dict:
+        return {
+            "address": row["location_address"],
+            "latitude": row["location_latitude"],
+            "longitude": row["location_longitude"],
+        }
+
+    def to_csv_row(self, output: PropertyOutput) -> list:
+        return [
+            output.id,
+            output.property_type,
+            output.room_count,
+            output.bathroom_count,
+            output.rent_value,
+            output.location.address,
+            output.location.latitude,
+            output.location.longitude,
+            json.dumps(output.additional_features),
+        ]
+
+    def from_csv_row(self, row: dict) -> PropertyCreateRequest:
+        return PropertyCreateRequest(
+            property_type=row.get("property_type"),
+            room_count=row.get("room_count"),
+            bathroom_count=row.get("bathroom_count"),
+            additional_features=json.loads(row.get("additional_features") or "{}"),
+            location=LocationCreateRequest(
+                address=row.get("location_address"),
+                latitude=row.get("location_latitude") or None,
+                longitude=row.get("location_longitude") or None,
+            ),
+            rent_value=row.get("rent_value"),
+        )
+
     def to_domain(self, create_request: PropertyCreateRequest) -> Property:
         return Property(
             property_type=create_request.property_type,
@@ -40,12 +138,16 @@ class PropertyMapper:
             rent_value=create_request.rent_value,
         )
 
-    def to_update(
-        self, entity: Property, update_request: PropertyUpdateRequest
-    ) -> Property:
-        property_data = entity.model_dump()
-        property_data.update(update_request.model_dump(exclude_unset=True))
-        return Property(**property_data)
+    def to_changes(self, update_request: PropertyUpdateRequest) -> dict:
+        changes = {
+            key: value
+            for key, value in update_request.model_dump(exclude_unset=True).items()
+            if value is not None
+        }
+        # A location is replaced as a whole, unset coordinates are cleared.
+        if update_request.location is not None:
+            changes["location"] = update_request.location.model_dump()
+        return changes
 
 
 class ConfigurationMapper:
@@ -57,6 +159,15 @@ class ConfigurationMapper:
             value=entity.value,
         )
 
+    def row_to_api(
+        self, row: Mapping, fields: list[str] | None = None
+    ) -> ConfigurationOutput:
+        values = {name: row[name] for name in fields or ("key", "type", "value")}
+        values["id"] = str(row["id"])
+        if fields is not None:
+            return partial_output(ConfigurationOutput, values)
+        return ConfigurationOutput.model_validate(values)
+
     def to_domain(self, create_request: ConfigurationCreateRequest) -> Configuration:
         return Configuration(
             key=create_request.key,
@@ -0,0 +1,157 @@
+import time
+from abc import ABC
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from uuid import UUID
+from uuid import uuid4
+
+from pydantic import BaseModel
+
+from property.domain.filters import BaseFilter
+
+
+class CacheStatistics(BaseModel):
+    enabled: bool = True
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class ICacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> Any | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    def evictions(self) -> int:
+        pass
+
+    @abstractmethod
+    def size(self) -> int:
+        pass
+
+
+class InMemoryCacheBackend(ICacheBackend):
+    def __init__(self, max_size: int = 10000, ttl: float = 30):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._evictions = 0
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def evictions(self) -> int:
+        return self._evictions
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class ResponseCache:
+    def __init__(self, backend: ICacheBackend, namespace: str = "properties"):
+        self.backend = backend
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+        self._generation = 0
+
+    def _item_keys(self, id: UUID) -> tuple[str, ...]:
+        return tuple(
+            f"{self.namespace}:item:{id}:{kind}" for kind in ("output", "version")
+        )
+
+    async def _list_key(self, filters: BaseFilter) -> str:
+        # Lists are keyed under a token replaced on every write, so one write
+        # drops every cached list without enumerating them.
+        token_key = f"{self.namespace}:lists"
+        token = await self.backend.get(token_key)
+        if token is None:
+            token = uuid4().hex
+            await self.backend.set(token_key, token)
+        return f"{self.namespace}:list:{token}:{filters.model_dump_json(exclude_defaults=True)}"
+
+    async def _get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await self.backend.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        generation = self._generation
+        value = await loader()
+        # A write that happened while loading makes this value stale.
+        if generation == self._generation:
+            await self.backend.set(key, value)
+        return value
+
+    async def get_item(
+        self, id: UUID, loader: Callable[[], Awaitable[Any]], kind: str = "output"
+    ) -> Any:
+        return await self._get_or_load(f"{self.namespace}:item:{id}:{kind}", loader)
+
+    async def get_list(
+        self, filters: BaseFilter, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        return await self._get_or_load(await self._list_key(filters), loader)
+
+    async def invalidate(self, id: UUID | None = None) -> None:
+        self._generation += 1
+        keys = [f"{self.namespace}:lists"]
+        if id is not None:
+            keys.extend(self._item_keys(id))
+        await self.backend.delete(*keys)
+
+    async def invalidate_notified(self, payload: str | None) -> None:
+        # Writes from other workers arrive as notifications carrying the id,
+        # without a payload some may have been missed.
+        if payload is None:
+            self._generation += 1
+            await self.backend.clear()
+            return
+        await self.invalidate(UUID(payload) if payload else None)
+
+    def stats(self) -> CacheStatistics:
+        return CacheStatistics(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.backend.evictions(),
+            size=self.backend.size(),
+        )
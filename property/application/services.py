@@ -1,3 +1,11 @@
+import csv
+import io
+from datetime import datetime
+from functools import partial
+from typing import Any
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
 from uuid import UUID
 
 from property.application.dtos import ConfigurationCreateRequest
@@ -5,121 +13,326 @@ from property.application.dtos import PropertyCreateRequest
 from property.application.dtos import ConfigurationUpdateRequest
 from property.application.dtos import PropertyUpdateRequest
 from property.application.dtos import ConfigurationOutput
+from property.application.dtos import PropertyBatchGetOutput
+from property.application.dtos import PropertyBatchGetRequest
+from property.application.dtos import PropertyBulkErrorOutput
+from property.application.dtos import PropertyBulkOutput
 from property.application.dtos import PropertyOutput
+from property.domain.enums import ExportFormat
+from property.domain.exceptions import BaseException
+from property.domain.exceptions import PreconditionFailedError
 from property.domain.exceptions import PropertyNotFoundError
+from property.application.cache import ConfigurationCache
+from property.application.coalescing import SingleFlight
+from property.application.group_commit import GroupCommitBuffer
+from property.application.response_cache import ResponseCache
 from property.application.mappers import ConfigurationMapper
 from property.application.mappers import PropertyMapper
 from property.domain.filters import ConfigurationFilter
 from property.domain.filters import PropertyFilter
 from property.domain.interfaces import IConfigurationRepository
 from property.domain.interfaces import IPropertyRepository
+from property.domain.models import Page
+from property.domain.models import Version
 
 
 class PropertyService:
     def __init__(
         self,
         property_repository: IPropertyRepository,
-        configuration_repository: IConfigurationRepository,
+        configuration_cache: ConfigurationCache,
+        response_cache: ResponseCache | None = None,
+        single_flight: SingleFlight | None = None,
+        write_buffer: GroupCommitBuffer | None = None,
     ):
         self.property_repository = property_repository
-        self.configuration_repository = configuration_repository
+        self.configuration_cache = configuration_cache
+        self.response_cache = response_cache
+        self.single_flight = single_flight
+        self.write_buffer = write_buffer
         self.mapper = PropertyMapper()
 
+    def _coalesced(
+        self, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Callable[[], Awaitable[Any]]:
+        if self.single_flight is None:
+            return loader
+        return partial(self.single_flight.do, key, loader)
+
+    async def _invalidate(self, id: UUID | None = None) -> None:
+        # A read between the write and its commit would cache the old row again.
+        await self.property_repository.after_commit(partial(self._forget, id))
+
+    async def _forget(self, id: UUID | None = None) -> None:
+        if self.single_flight is not None:
+            self.single_flight.forget()
+        if self.response_cache is not None:
+            await self.response_cache.invalidate(id)
+
     async def create_property(
         self, create_request: PropertyCreateRequest
     ) -> PropertyOutput:
         entity = self.mapper.to_domain(create_request)
 
-        property_type_config = await self.configuration_repository.list(
-            ConfigurationFilter(key_eq=create_request.property_type)
+        validator = await self.configuration_cache.get_validator()
+        entity.is_valid_property_type(validator)
+        entity.is_valid_additional_features(validator)
+
+        if self.write_buffer is None:
+            created_entity = await self.property_repository.create(entity)
+        else:
+            created_entity = await self.write_buffer.create(entity)
+        await self._invalidate()
+        return self.mapper.to_api(created_entity)
+
+    async def create_properties(
+        self, create_requests: list[PropertyCreateRequest]
+    ) -> PropertyBulkOutput:
+        validator = await self.configuration_cache.get_validator()
+        entities = []
+        errors = []
+        for index, create_request in enumerate(create_requests):
+            entity = self.mapper.to_domain(create_request)
+            try:
+                entity.is_valid_property_type(validator)
+                entity.is_valid_additional_features(validator)
+            except BaseException as error:
+                errors.append(
+                    PropertyBulkErrorOutput(
+                        index=index,
+                        status_code=error.status_code,
+                        message=error.message,
+                    )
+                )
+                continue
+            entities.append((index, entity))
+
+        # Rows the database rejects are reported without failing the others.
+        results = await self.property_repository.create_each(
+            [entity for _, entity in entities]
         )
-        entity.is_valid_property_type(property_type_config)
-        additional_features_config = await self.configuration_repository.list(
-            ConfigurationFilter(key_in=list(entity.additional_features.keys()))
+        created_entities = []
+        for (index, _), result in zip(entities, results):
+            if isinstance(result, BaseException):
+                errors.append(
+                    PropertyBulkErrorOutput(
+                        index=index,
+                        status_code=result.status_code,
+                        message=result.message,
+                    )
+                )
+            else:
+                created_entities.append(result)
+        if created_entities:
+            await self._invalidate()
+        return PropertyBulkOutput(
+            created=[self.mapper.to_api(entity) for entity in created_entities],
+            errors=sorted(errors, key=lambda error: error.index),
         )
-        entity.is_valid_additional_features(additional_features_config)
 
-        created_entity = await self.property_repository.create(entity)
-        return self.mapper.to_api(created_entity)
+    async def list_properties(self, filters: PropertyFilter) -> Page[PropertyOutput]:
+        load = self._coalesced(
+            f"list:{filters.model_dump_json(exclude_defaults=True)}",
+            partial(self._list_properties, filters, self.response_cache is not None),
+        )
+        if self.response_cache is None:
+            return await load()
+        return await self.response_cache.get_list(filters, load)
 
-    async def list_properties(self, filters: PropertyFilter):
-        entities = await self.property_repository.list(filters)
-        return [self.mapper.to_api(entity) for entity in entities]
+    async def _list_properties(
+        self, filters: PropertyFilter, primary: bool = False
+    ) -> Page[PropertyOutput]:
+        # Cached values outlive the read, a lagging replica would pin old rows.
+        page = await self.property_repository.list_rows(filters, primary)
+        return Page.model_construct(
+            items=[self.mapper.row_to_api(row, filters.fields) for row in page.items],
+            next_cursor=page.next_cursor,
+        )
 
-    async def get_property_by_id(self, id: UUID):
-        filter = PropertyFilter(id_eq=id)
-        entities = await self.property_repository.list(filter)
-        if len(entities) == 0:
-            raise PropertyNotFoundError(id)
-        return self.mapper.to_api(entities[0])
+    async def batch_get_properties(
+        self, batch_request: PropertyBatchGetRequest
+    ) -> PropertyBatchGetOutput:
+        ids = list(dict.fromkeys(batch_request.ids))
+        page = await self.property_repository.list_rows(PropertyFilter(id_in=ids))
+        rows = {row["id"]: row for row in page.items}
+        return PropertyBatchGetOutput.model_construct(
+            items=[self.mapper.row_to_api(rows[id]) for id in ids if id in rows],
+            missing=[str(id) for id in ids if id not in rows],
+        )
 
-    async def update_property(self, id: UUID, update_request: PropertyUpdateRequest):
-        entity = await self.get_property_by_id(id)
-        if not entity:
+    async def export_properties(
+        self, filters: PropertyFilter, format: ExportFormat, chunk_size: int = 500
+    ) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if format == ExportFormat.CSV:
+            writer.writerow(self.mapper.csv_columns)
+
+        count = 0
+        async for entity in self.property_repository.stream(filters):
+            output = self.mapper.to_api(entity)
+            if format == ExportFormat.CSV:
+                writer.writerow(self.mapper.to_csv_row(output))
+            else:
+                buffer.write(output.model_dump_json())
+                buffer.write("\n")
+            count += 1
+            if count % chunk_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    async def get_property_by_id(
+        self, id: UUID, fields: list[str] | None = None
+    ) -> tuple[PropertyOutput, Version]:
+        cached = self.response_cache is not None and fields is None
+        load = self._coalesced(
+            f"item:{id}:{fields}",
+            partial(self._get_property_by_id, id, fields, cached),
+        )
+        if not cached:
+            return await load()
+        return await self.response_cache.get_item(id, load)
+
+    async def _get_property_by_id(
+        self, id: UUID, fields: list[str] | None, primary: bool = False
+    ) -> tuple[PropertyOutput, Version]:
+        filter = PropertyFilter(id_eq=id, fields=fields)
+        page = await self.property_repository.list_rows(filter, primary)
+        if len(page.items) == 0:
             raise PropertyNotFoundError(id)
-        updated_entity = self.mapper.to_update(entity, update_request)
+        row = page.items[0]
+        version = Version(count=1, updated_at=row["updated_at"])
+        return self.mapper.row_to_api(row, filter.fields), version
 
-        if update_request.property_type:
-            property_type_config = await self.configuration_repository.list(
-                ConfigurationFilter(key_eq=update_request.property_type)
-            )
-            updated_entity.is_valid_property_type(property_type_config)
-        if update_request.additional_features:
-            additional_features_config = await self.configuration_repository.list(
-                ConfigurationFilter(key_in=list(entity.additional_features.keys()))
-            )
-            entity.is_valid_additional_features(additional_features_config)
+    async def get_property_version(self, id: UUID, use_cache: bool = True) -> Version:
+        filters = PropertyFilter(id_eq=id)
+        if not use_cache:
+            return await self.property_repository.version(filters)
+        load = self._coalesced(
+            f"version:{id}",
+            partial(
+                self.property_repository.version,
+                filters,
+                self.response_cache is not None,
+            ),
+        )
+        if self.response_cache is None:
+            return await load()
+        return await self.response_cache.get_item(id, load, kind="version")
 
-        entity = await self.property_repository.update(updated_entity)
-        return self.mapper.to_api(entity)
+    async def update_property(
+        self,
+        id: UUID,
+        update_request: PropertyUpdateRequest,
+        updated_at_in: list[datetime] | None = None,
+    ) -> tuple[PropertyOutput, Version]:
+        changes = self.mapper.to_changes(update_request)
+
+        validator = await self.configuration_cache.get_validator()
+        if "property_type" in changes:
+            validator.validate_property_type(changes["property_type"])
+        if "additional_features" in changes:
+            validator.validate_additional_features(changes["additional_features"])
+
+        entity = await self.property_repository.update(id, changes, updated_at_in)
+        if entity is None:
+            if updated_at_in is not None:
+                version = await self.get_property_version(id, use_cache=False)
+                if version.count:
+                    raise PreconditionFailedError(id)
+            raise PropertyNotFoundError(id)
+        await self._invalidate(id)
+        version = Version(count=1, updated_at=entity.updated_at)
+        return self.mapper.to_api(entity), version
 
     async def delete_property(self, id: UUID):
-        entity = await self.get_property_by_id(id)
-        if not entity:
+        entity = await self.property_repository.delete(id)
+        if entity is None:
             raise PropertyNotFoundError(id)
-        return await self.property_repository.delete(entity)
+        await self._invalidate(id)
 
 
 class ConfigurationService:
     def __init__(
         self,
         configuration_repository: IConfigurationRepository,
+        configuration_cache: ConfigurationCache,
     ):
         self.configuration_repository = configuration_repository
+        self.configuration_cache = configuration_cache
         self.mapper = ConfigurationMapper()
 
     async def create_configuration(
         self, create_request: ConfigurationCreateRequest
-    ) -> ConfigurationOutput:
+    ) -> tuple[ConfigurationOutput, Version]:
         entity = self.mapper.to_domain(create_request)
         entity.is_valid_configuration()
         created_entity = await self.configuration_repository.create(entity)
-        return self.mapper.to_api(created_entity)
+        await self.configuration_repository.after_commit(
+            self.configuration_cache.invalidate
+        )
+        version = Version(count=1, updated_at=created_entity.updated_at)
+        return self.mapper.to_api(created_entity), version
 
-    async def list_configurations(self, filters: ConfigurationFilter):
-        entities = await self.configuration_repository.list(filters)
-        return [self.mapper.to_api(entity) for entity in entities]
+    async def list_configurations(
+        self, filters: ConfigurationFilter
+    ) -> tuple[Page[ConfigurationOutput], Version]:
+        page = await self.configuration_repository.list_rows(filters)
+        output = Page.model_construct(
+            items=[self.mapper.row_to_api(row, filters.fields) for row in page.items],
+            next_cursor=page.next_cursor,
+        )
+        return output, Version.of_rows(page.items, page.next_cursor)
+
+    async def list_configurations_version(
+        self, filters: ConfigurationFilter
+    ) -> Version:
+        # Only the keys of the page are read, they are all its ETag depends on.
+        keys = filters.model_copy(update={"fields": ["id"]})
+        page = await self.configuration_repository.list_rows(keys)
+        return Version.of_rows(page.items, page.next_cursor)
 
-    async def get_configuration_by_id(self, id: UUID):
-        filter = ConfigurationFilter(id_eq=id)
-        entities = await self.configuration_repository.list(filter)
-        if len(entities) == 0:
+    async def get_configuration_by_id(
+        self, id: UUID, fields: list[str] | None = None
+    ) -> tuple[ConfigurationOutput, Version]:
+        filter = ConfigurationFilter(id_eq=id, fields=fields)
+        page = await self.configuration_repository.list_rows(filter)
+        if len(page.items) == 0:
             raise PropertyNotFoundError(id)
-        return self.mapper.to_api(entities[0])
+        row = page.items[0]
+        version = Version(count=1, updated_at=row["updated_at"])
+        return self.mapper.row_to_api(row, filter.fields), version
 
     async def update_configuration(
-        self, id: UUID, update_request: ConfigurationUpdateRequest
-    ):
-        entity = await self.get_configuration_by_id(id)
+        self,
+        id: UUID,
+        update_request: ConfigurationUpdateRequest,
+        updated_at_in: list[datetime] | None = None,
+    ) -> tuple[ConfigurationOutput, Version]:
+        entity, _ = await self.get_configuration_by_id(id)
         if not entity:
             raise PropertyNotFoundError(id)
         updated_entity = self.mapper.to_update(entity, update_request)
         updated_entity.is_valid_configuration()
-        entity = await self.configuration_repository.update(updated_entity)
-        return self.mapper.to_api(entity)
+        entity = await self.configuration_repository.update(
+            id, update_request.model_dump(exclude_unset=True), updated_at_in
+        )
+        if entity is None:
+            if updated_at_in is not None:
+                raise PreconditionFailedError(id)
+            raise PropertyNotFoundError(id)
+        await self.configuration_repository.after_commit(
+            self.configuration_cache.invalidate
+        )
+        version = Version(count=1, updated_at=entity.updated_at)
+        return self.mapper.to_api(entity), version
 
     async def delete_configuration(self, id: UUID):
-        entity = await self.get_configuration_by_id(id)
-        if not entity:
+        entity = await self.configuration_repository.delete(id)
+        if entity is None:
             raise PropertyNotFoundError(id)
-        return await self.configuration_repository.delete(entity)
+        await self.configuration_repository.after_commit(
+            self.configuration_cache.invalidate
+        )
@@ -0,0 +1,65 @@
+import argparse
+import asyncio
+import sys
+
+from property.application.dtos import PropertyImportOutput
+from property.domain.enums import ExportFormat
+from property.settings import create_container
+
+
+async def read_chunks(path: str, chunk_size: int):
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+def print_progress(report: PropertyImportOutput) -> None:
+    print(
+        f"[{report.status.value}] processed={report.processed} "
+        f"created={report.created} failed={report.failed}",
+        file=sys.stderr,
+    )
+
+
+async def import_properties(args: argparse.Namespace) -> int:
+    container = create_container()
+    importer = container.property_importer()
+    if args.batch_size:
+        importer.batch_size = args.batch_size
+    format = args.format or (
+        ExportFormat.CSV if args.path.endswith(".csv") else ExportFormat.NDJSON
+    )
+    try:
+        report = await importer.import_properties(
+            read_chunks(args.path, args.chunk_size), format, on_progress=print_progress
+        )
+    finally:
+        await container.db_connection().close()
+    print(report.model_dump_json(indent=2))
+    error_file = importer.get_import_errors(report.id)
+    if error_file is not None:
+        print(f"Rejected rows were written to {error_file}", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m property.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser(
+        "import", help="Import properties from an NDJSON or CSV file"
+    )
+    import_parser.add_argument("path")
+    import_parser.add_argument(
+        "--format", type=ExportFormat, choices=list(ExportFormat)
+    )
+    import_parser.add_argument("--batch-size", type=int)
+    import_parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    import_parser.set_defaults(handler=import_properties)
+
+    args = parser.parse_args(argv)
+    return asyncio.run(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
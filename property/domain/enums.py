@@ -5,3 +5,14 @@ class ConfigurationType(str, Enum):
     SELECT = "select"
     TEXT = "text"
     NUMBER = "number"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ImportStatus(str, Enum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
@@ -34,3 +34,27 @@ class NotValidValueAdditionalFeatureError(BaseException):
     def __init__(self, key: str, invalid_value: str):
         self.status_code = status.HTTP_400_BAD_REQUEST
         self.message = f"Value '{invalid_value}' for key '{key}' is not valid"
+
+
+class InvalidCursorError(BaseException):
+    def __init__(self, cursor: str):
+        self.status_code = status.HTTP_400_BAD_REQUEST
+        self.message = f"Cursor '{cursor}' is not valid"
+
+
+class ImportNotFoundError(BaseException):
+    def __init__(self, import_id: str):
+        self.status_code = status.HTTP_404_NOT_FOUND
+        self.message = f"Import with id '{import_id}' not found"
+
+
+class PreconditionFailedError(BaseException):
+    def __init__(self, id: str):
+        self.status_code = status.HTTP_412_PRECONDITION_FAILED
+        self.message = f"Record with id '{id}' was modified by another request"
+
+
+class RecordNotWrittenError(BaseException):
+    def __init__(self, reason: str):
+        self.status_code = status.HTTP_400_BAD_REQUEST
+        self.message = f"Record could not be written: {reason}"
@@ -1,11 +1,44 @@
 from uuid import UUID
+from datetime import datetime
+from typing import ClassVar
 from pydantic import BaseModel
+from pydantic import Field
+from pydantic import field_validator
+from pydantic import model_validator
+
+
+def split_feature(value: str) -> tuple[str, str]:
+    key, separator, feature_value = value.partition(":")
+    if not key or not separator:
+        raise ValueError(f"'{value}' must have the form 'key:value'")
+    return key, feature_value
 
 
 class BaseFilter(BaseModel):
+    selectable_fields: ClassVar[frozenset[str]] = frozenset()
+
     size: int | None = None
     page: int | None = None
     order_by: str | None = None
+    cursor: str | None = None
+    fields: list[str] | None = None
+
+    @field_validator("fields")
+    @classmethod
+    def validate_fields(cls, value: list[str] | None) -> list[str] | None:
+        if value is None:
+            return None
+        # Accepts both fields=id,rent_value and repeated fields parameters.
+        fields = [
+            field.strip()
+            for item in value
+            for field in item.split(",")
+            if field.strip()
+        ]
+        unknown = [field for field in fields if field not in cls.selectable_fields]
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+        return list(dict.fromkeys(fields)) or None
 
     @property
     def offset(self) -> int | None:
@@ -19,10 +52,85 @@ class BaseFilter(BaseModel):
 
 
 class PropertyFilter(BaseFilter):
+    selectable_fields = frozenset(
+        {
+            "id",
+            "property_type",
+            "room_count",
+            "bathroom_count",
+            "additional_features",
+            "location",
+            "rent_value",
+        }
+    )
+
     id_eq: UUID | None = None
+    id_in: list[UUID] | None = None
+    q: str | None = Field(default=None, min_length=1, max_length=200)
+    property_type_eq: str | None = None
+    property_type_in: list[str] | None = None
+    rent_value_gte: float | None = None
+    rent_value_lte: float | None = None
+    room_count_gte: int | None = None
+    room_count_lte: int | None = None
+    bathroom_count_gte: int | None = None
+    bathroom_count_lte: int | None = None
+    updated_at_gte: datetime | None = None
+    updated_at_lte: datetime | None = None
+    feature_eq: list[str] | None = None
+    feature_exists: list[str] | None = None
+    feature_gte: list[str] | None = None
+    feature_lte: list[str] | None = None
+    near_lat: float | None = Field(default=None, ge=-90, le=90)
+    near_lon: float | None = Field(default=None, ge=-180, le=180)
+    radius_km: float | None = Field(default=None, gt=0)
+    min_lat: float | None = Field(default=None, ge=-90, le=90)
+    max_lat: float | None = Field(default=None, ge=-90, le=90)
+    min_lon: float | None = Field(default=None, ge=-180, le=180)
+    max_lon: float | None = Field(default=None, ge=-180, le=180)
+
+    @model_validator(mode="after")
+    def validate_location(self) -> "PropertyFilter":
+        near = (self.near_lat, self.near_lon, self.radius_km)
+        if any(v is not None for v in near) and any(v is None for v in near):
+            raise ValueError("near_lat, near_lon and radius_km must be used together")
+        box = (self.min_lat, self.max_lat, self.min_lon, self.max_lon)
+        if any(v is not None for v in box):
+            if any(v is None for v in box):
+                raise ValueError(
+                    "min_lat, max_lat, min_lon and max_lon must be used together"
+                )
+            if self.min_lat > self.max_lat or self.min_lon > self.max_lon:
+                raise ValueError("Bounding box minimums must not exceed maximums")
+        return self
+
+    @property
+    def is_near(self) -> bool:
+        return self.radius_km is not None
+
+    @property
+    def is_bounding_box(self) -> bool:
+        return self.min_lat is not None
+
+    @field_validator("feature_eq")
+    @classmethod
+    def validate_feature_eq(cls, value: list[str] | None) -> list[str] | None:
+        for item in value or []:
+            split_feature(item)
+        return value
+
+    @field_validator("feature_gte", "feature_lte")
+    @classmethod
+    def validate_feature_range(cls, value: list[str] | None) -> list[str] | None:
+        for item in value or []:
+            float(split_feature(item)[1])
+        return value
 
 
 class ConfigurationFilter(BaseFilter):
+    selectable_fields = frozenset({"id", "key", "type", "value"})
+
     id_eq: UUID | None = None
+    id_in: list[UUID] | None = None
     key_eq: str | None = None
     key_in: list[str] | None = None
@@ -1,24 +1,68 @@
 from abc import ABC
 from abc import abstractmethod
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Mapping
+from typing import Sequence
+from uuid import UUID
 
 from property.domain.models import BaseEntity
+from property.domain.models import Page
+from property.domain.models import Version
 
 
 class IBaseRepository(ABC):
     @abstractmethod
-    async def create(self) -> BaseEntity:
+    async def create(self, entity: BaseEntity) -> BaseEntity:
         pass
 
     @abstractmethod
-    async def list(self, filters) -> list[BaseEntity]:
+    async def create_many(self, entities: list[BaseEntity]) -> list[BaseEntity]:
         pass
 
     @abstractmethod
-    async def delete(self) -> None:
+    async def create_each(
+        self, entities: list[BaseEntity]
+    ) -> list[BaseEntity | BaseException]:
         pass
 
     @abstractmethod
-    async def update(self) -> BaseEntity:
+    async def copy_many(self, entities: list[BaseEntity]) -> int:
+        pass
+
+    @abstractmethod
+    async def list(self, filters, primary: bool = False) -> list[BaseEntity]:
+        pass
+
+    @abstractmethod
+    async def list_page(self, filters, primary: bool = False) -> Page[BaseEntity]:
+        pass
+
+    @abstractmethod
+    async def list_rows(self, filters, primary: bool = False) -> Page[Mapping]:
+        pass
+
+    @abstractmethod
+    async def version(self, filters, primary: bool = False) -> Version:
+        pass
+
+    @abstractmethod
+    def stream(self, filters) -> AsyncIterator[BaseEntity]:
+        pass
+
+    @abstractmethod
+    async def delete(self, id: UUID) -> BaseEntity | None:
+        pass
+
+    @abstractmethod
+    async def update(
+        self, id: UUID, changes: dict, updated_at_in: Sequence | None = None
+    ) -> BaseEntity | None:
+        pass
+
+    @abstractmethod
+    async def after_commit(self, callback: Callable[[], Awaitable[None] | None]):
         pass
 
 
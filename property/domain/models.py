@@ -1,12 +1,15 @@
+import hashlib
 from uuid import UUID
 from datetime import datetime
+from typing import Generic
+from typing import Mapping
+from typing import Sequence
+from typing import TypeVar
 from pydantic import BaseModel, ConfigDict
 
 from property.domain.exceptions import ConfigurationNotValidError
-from property.domain.exceptions import NotValidPropertyError
-from property.domain.exceptions import NotAllAdditionalFeatureError
-from property.domain.exceptions import NotValidValueAdditionalFeatureError
 from property.domain.enums import ConfigurationType
+from property.domain.validators import ConfigurationValidator
 
 
 class BaseEntity(BaseModel):
@@ -21,6 +24,32 @@ class BaseEntity(BaseModel):
     )
 
 
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None = None
+
+
+class Version(BaseModel):
+    count: int
+    updated_at: datetime | None = None
+    # Collections also hash their ids, a delete does not move updated_at.
+    digest: str | None = None
+
+    @classmethod
+    def of_rows(cls, rows: Sequence[Mapping], next_cursor: str | None = None):
+        digest = hashlib.sha1((next_cursor or "").encode())
+        for row in rows:
+            digest.update(f"{row['id']}:{row['updated_at'].isoformat()};".encode())
+        return cls(
+            count=len(rows),
+            updated_at=max((row["updated_at"] for row in rows), default=None),
+            digest=digest.hexdigest()[:16],
+        )
+
+
 class Location(BaseModel):
     address: str
     latitude: float | None = None
@@ -35,28 +64,19 @@ class Property(BaseEntity):
     location: Location
     rent_value: float
 
-    def is_valid_property_type(self, configurations: list["Configuration"]):
-        if not configurations:
-            raise NotValidPropertyError(self.property_type)
-
-    def is_valid_additional_features(self, configurations: list["Configuration"]):
-        if len(self.additional_features.keys()) != len(configurations):
-            raise NotAllAdditionalFeatureError()
-        for conf in configurations:
-            val = self.additional_features.get(conf.key)
-            if conf.type == ConfigurationType.SELECT:
-                if val not in conf.value:
-                    raise NotValidValueAdditionalFeatureError(
-                        key=conf.key, invalid_value=val
-                    )
-            elif conf.type == ConfigurationType.NUMBER and not isinstance(val, int):
-                raise NotValidValueAdditionalFeatureError(
-                    key=conf.key, invalid_value=val
-                )
-            elif conf.type == ConfigurationType.TEXT and val is not None:
-                raise NotValidValueAdditionalFeatureError(
-                    key=conf.key, invalid_value=val
-                )
+    def is_valid_property_type(
+        self, configurations: "ConfigurationValidator | list[Configuration]"
+    ):
+        ConfigurationValidator.of(configurations).validate_property_type(
+            self.property_type
+        )
+
+    def is_valid_additional_features(
+        self, configurations: "ConfigurationValidator | list[Configuration]"
+    ):
+        ConfigurationValidator.of(configurations).validate_additional_features(
+            self.additional_features
+        )
 
 
 class Configuration(BaseEntity):
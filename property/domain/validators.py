@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Callable
+
+from property.domain.enums import ConfigurationType
+from property.domain.exceptions import NotAllAdditionalFeatureError
+from property.domain.exceptions import NotValidPropertyError
+from property.domain.exceptions import NotValidValueAdditionalFeatureError
+
+if TYPE_CHECKING:
+    from property.domain.models import Configuration
+
+
+def _select_rule(options: frozenset) -> Callable[[Any], bool]:
+    def rule(value: Any) -> bool:
+        try:
+            return value in options
+        except TypeError:
+            return False
+
+    return rule
+
+
+def _number_rule(value: Any) -> bool:
+    return isinstance(value, int)
+
+
+def _text_rule(value: Any) -> bool:
+    return value is None
+
+
+class ConfigurationValidator:
+    def __init__(self, configurations: list["Configuration"]):
+        self.keys = frozenset(conf.key for conf in configurations)
+        self.rules: dict[str, Callable[[Any], bool]] = {}
+        for conf in configurations:
+            if conf.type == ConfigurationType.SELECT:
+                self.rules[conf.key] = _select_rule(frozenset(conf.value or ()))
+            elif conf.type == ConfigurationType.NUMBER:
+                self.rules[conf.key] = _number_rule
+            elif conf.type == ConfigurationType.TEXT:
+                self.rules[conf.key] = _text_rule
+
+    @classmethod
+    def of(
+        cls, configurations: "ConfigurationValidator | list[Configuration]"
+    ) -> "ConfigurationValidator":
+        if isinstance(configurations, cls):
+            return configurations
+        return cls(configurations)
+
+    def validate_property_type(self, property_type: str) -> None:
+        if property_type not in self.keys:
+            raise NotValidPropertyError(property_type)
+
+    def validate_additional_features(self, additional_features: dict) -> None:
+        if not self.keys.issuperset(additional_features):
+            raise NotAllAdditionalFeatureError()
+        rules = self.rules
+        for key, value in additional_features.items():
+            rule = rules.get(key)
+            if rule is not None and not rule(value):
+                raise NotValidValueAdditionalFeatureError(key=key, invalid_value=value)
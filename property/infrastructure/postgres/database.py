@@ -1,32 +1,321 @@
+import asyncio
+import inspect
 import logging
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import time
+from contextvars import ContextVar
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
+from typing import Awaitable
+from typing import Callable
 from sqlalchemy import NullPool
+from sqlalchemy import make_url
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from pydantic import BaseModel
 
 
 logger = logging.getLogger(__name__)
 
+# Zero on a caught up replica, a quiet primary has no replay timestamp to age.
+REPLICATION_LAG_QUERY = text(
+    "SELECT CASE WHEN NOT pg_is_in_recovery()"
+    " OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END"
+)
+
+
+class ReplicaStatistics(BaseModel):
+    url: str
+    healthy: bool
+    acquisitions: int
+    lag_seconds: float | None = None
+
+
+class PoolStatistics(BaseModel):
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    waiters: int
+    acquisitions: int
+    acquire_time_avg_ms: float
+    acquire_time_max_ms: float
+    replicas: list[ReplicaStatistics] = []
+
+
+class _Replica:
+    def __init__(self, url: str, engine: AsyncEngine):
+        self.url = make_url(url).render_as_string(hide_password=True)
+        self.engine = engine
+        self.session_factory = sessionmaker(bind=engine, class_=AsyncSession)
+        self.down_until = 0.0
+        self.acquisitions = 0
+        self.lag: float | None = None
+
+    def is_healthy(self) -> bool:
+        return time.monotonic() >= self.down_until
+
+
+class _UnitOfWork:
+    def __init__(self, db_connection: "DbConnection"):
+        self.db_connection = db_connection
+        self.session: AsyncSession | None = None
+        self.read_session: AsyncSession | None = None
+        self.wrote = False
+        self.after_commit: list[Callable[[], Awaitable[None] | None]] = []
+
+
+_current_unit_of_work: ContextVar[_UnitOfWork | None] = ContextVar(
+    "current_unit_of_work", default=None
+)
+
 
 class DbConnection:
-    def __init__(self, db_url: str):
+    def __init__(
+        self,
+        db_url: str,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = False,
+        pool_timeout: float = 30,
+        pool_warmup: int = 0,
+        replica_urls: list[str] | None = None,
+        replica_retry_interval: float = 10,
+        replica_max_lag: float = 5,
+        replica_health_check_interval: float = 5,
+        read_your_writes: bool = True,
+    ):
         if not db_url:
             raise Exception("Database URL is required")
 
-        self.engine = create_async_engine(db_url, poolclass=NullPool)
+        def create_engine(url: str, pre_ping: bool) -> AsyncEngine:
+            if pool_size > 0:
+                return create_async_engine(
+                    url,
+                    pool_size=pool_size,
+                    max_overflow=max_overflow,
+                    pool_recycle=pool_recycle,
+                    pool_pre_ping=pre_ping,
+                    pool_timeout=pool_timeout,
+                )
+            return create_async_engine(url, poolclass=NullPool)
 
+        self.engine = create_engine(db_url, pool_pre_ping)
         self.session_factory = sessionmaker(
             bind=self.engine,
             class_=AsyncSession,
         )
+        # Replica connections are always pinged, a dead one must not be handed out.
+        self.replicas = [
+            _Replica(url, create_engine(url, True)) for url in replica_urls or []
+        ]
+        self.replica_retry_interval = replica_retry_interval
+        self.replica_max_lag = replica_max_lag
+        self.replica_health_check_interval = replica_health_check_interval
+        self._health_check_task: asyncio.Task | None = None
+        self.read_your_writes = read_your_writes
+        self._next_replica = 0
+
+        self.pool_warmup = min(pool_warmup, max(pool_size, 0))
+        self._waiters = 0
+        self._acquisitions = 0
+        self._acquire_time_total = 0.0
+        self._acquire_time_max = 0.0
 
     @asynccontextmanager
-    async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
-        async with self.session_factory() as session:
+    async def get_session(
+        self, read_only: bool = False
+    ) -> AsyncGenerator[AsyncSession, None]:
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is not None and unit_of_work.db_connection is self:
+            # The unit of work owns the commit and the rollback.
+            yield await self._unit_of_work_session(unit_of_work, read_only)
+            return
+        replica_session = await self._replica_session() if read_only else None
+        async with replica_session or self.session_factory() as session:
             try:
+                if replica_session is None:
+                    await self._acquire(session)
                 yield session
+                await session.commit()
             except Exception as e:
                 await session.rollback()
-                logger.exception("Database transaction failed: %s", e)
+                if isinstance(e, SQLAlchemyError):
+                    logger.exception("Database transaction failed: %s", e)
                 raise
+
+    async def _unit_of_work_session(
+        self, unit_of_work: _UnitOfWork, read_only: bool
+    ) -> AsyncSession:
+        if not read_only:
+            unit_of_work.wrote = True
+        elif not (self.read_your_writes and unit_of_work.wrote):
+            if unit_of_work.read_session is None:
+                unit_of_work.read_session = await self._replica_session()
+            if unit_of_work.read_session is not None:
+                return unit_of_work.read_session
+        if unit_of_work.session is None:
+            unit_of_work.session = self.session_factory()
+            await self._acquire(unit_of_work.session)
+        return unit_of_work.session
+
+    async def _replica_session(self) -> AsyncSession | None:
+        # Round robin over healthy replicas, None sends the read to the primary.
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next_replica % len(self.replicas)]
+            self._next_replica += 1
+            if not replica.is_healthy():
+                continue
+            session = replica.session_factory()
+            try:
+                await self._acquire(session)
+            except (OSError, SQLAlchemyError) as e:
+                await session.close()
+                replica.down_until = time.monotonic() + self.replica_retry_interval
+                logger.warning("Replica %s is unavailable: %s", replica.url, e)
+                continue
+            replica.acquisitions += 1
+            return session
+        return None
+
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncGenerator[None, None]:
+        unit_of_work = _UnitOfWork(self)
+        token = _current_unit_of_work.set(unit_of_work)
+        try:
+            yield
+            if unit_of_work.session is not None:
+                await unit_of_work.session.commit()
+        except Exception as e:
+            unit_of_work.after_commit.clear()
+            if unit_of_work.session is not None:
+                await unit_of_work.session.rollback()
+            if isinstance(e, SQLAlchemyError):
+                logger.exception("Database transaction failed: %s", e)
+            raise
+        finally:
+            _current_unit_of_work.reset(token)
+            for session in (unit_of_work.session, unit_of_work.read_session):
+                if session is not None:
+                    await session.close()
+        for callback in unit_of_work.after_commit:
+            await self._run_after_commit(callback)
+
+    async def after_commit(
+        self, callback: Callable[[], Awaitable[None] | None]
+    ) -> None:
+        # Inside a unit of work the write is only visible once it commits,
+        # outside of one every session has already committed.
+        unit_of_work = _current_unit_of_work.get()
+        if unit_of_work is not None and unit_of_work.db_connection is self:
+            unit_of_work.after_commit.append(callback)
+            return
+        await self._run_after_commit(callback)
+
+    async def _run_after_commit(
+        self, callback: Callable[[], Awaitable[None] | None]
+    ) -> None:
+        try:
+            result = callback()
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.exception("After commit callback failed")
+
+    async def _acquire(self, session: AsyncSession) -> None:
+        self._waiters += 1
+        start = time.perf_counter()
+        try:
+            await session.connection()
+        finally:
+            self._waiters -= 1
+        elapsed = time.perf_counter() - start
+        self._acquisitions += 1
+        self._acquire_time_total += elapsed
+        self._acquire_time_max = max(self._acquire_time_max, elapsed)
+
+    async def warm_up(self) -> None:
+        if not self.pool_warmup:
+            return
+        connections = await asyncio.gather(
+            *(self.engine.connect().start() for _ in range(self.pool_warmup))
+        )
+        for connection in connections:
+            await connection.close()
+        logger.info("Database pool warmed up with %s connections", self.pool_warmup)
+
+    async def check_replicas(self) -> None:
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as connection:
+                    lag = await asyncio.wait_for(
+                        connection.scalar(REPLICATION_LAG_QUERY),
+                        timeout=self.replica_health_check_interval,
+                    )
+            except (OSError, SQLAlchemyError) as e:
+                replica.lag = None
+                replica.down_until = time.monotonic() + self.replica_retry_interval
+                logger.warning("Replica %s is unavailable: %s", replica.url, e)
+                continue
+            replica.lag = float(lag)
+            if replica.lag > self.replica_max_lag:
+                replica.down_until = time.monotonic() + self.replica_retry_interval
+                logger.warning("Replica %s lags %.1fs", replica.url, replica.lag)
+            else:
+                replica.down_until = 0.0
+
+    async def _check_replicas_forever(self) -> None:
+        while True:
+            try:
+                await self.check_replicas()
+            except Exception:
+                logger.exception("Replica health check failed")
+            await asyncio.sleep(self.replica_health_check_interval)
+
+    def start_health_checks(self) -> None:
+        if self.replicas and self._health_check_task is None:
+            self._health_check_task = asyncio.create_task(
+                self._check_replicas_forever()
+            )
+
+    async def close(self) -> None:
+        if self._health_check_task is not None:
+            self._health_check_task.cancel()
+            try:
+                await self._health_check_task
+            except asyncio.CancelledError:
+                pass
+            self._health_check_task = None
+        await self.engine.dispose()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def pool_stats(self) -> PoolStatistics:
+        pool = self.engine.pool
+        size = pool.size() if hasattr(pool, "size") else 0
+        idle = pool.checkedin() if hasattr(pool, "checkedin") else 0
+        acquisitions = self._acquisitions
+        return PoolStatistics(
+            size=size,
+            checked_out=pool.checkedout() if hasattr(pool, "checkedout") else 0,
+            idle=idle,
+            overflow=max(pool.overflow(), 0) if hasattr(pool, "overflow") else 0,
+            waiters=self._waiters,
+            acquisitions=acquisitions,
+            acquire_time_avg_ms=(
+                self._acquire_time_total / acquisitions * 1000 if acquisitions else 0.0
+            ),
+            acquire_time_max_ms=self._acquire_time_max * 1000,
+            replicas=[
+                ReplicaStatistics(
+                    url=replica.url,
+                    healthy=replica.is_healthy(),
+                    acquisitions=replica.acquisitions,
+                    lag_seconds=replica.lag,
+                )
+                for replica in self.replicas
+            ],
+        )
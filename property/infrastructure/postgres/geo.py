@@ -0,0 +1,77 @@
+import math
+
+from sqlalchemy import func
+
+
+EARTH_RADIUS_KM = 6371.0088
+
+# Grid cells are CELLS_PER_DEGREE x CELLS_PER_DEGREE of a degree (~11 km at 10).
+CELLS_PER_DEGREE = 10
+LATITUDE_CELLS = 180 * CELLS_PER_DEGREE
+LONGITUDE_CELLS = 360 * CELLS_PER_DEGREE
+MAX_CELLS = 256
+
+CELL_EXPRESSION = (
+    f"(floor(location_latitude * {CELLS_PER_DEGREE})::int + {LATITUDE_CELLS // 2})"
+    f" * {LONGITUDE_CELLS}"
+    f" + (floor(location_longitude * {CELLS_PER_DEGREE})::int + {LONGITUDE_CELLS // 2})"
+)
+
+
+def bounding_boxes(
+    latitude: float, longitude: float, radius_km: float
+) -> list[tuple[float, float, float, float]]:
+    delta_latitude = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_latitude = max(latitude - delta_latitude, -90.0)
+    max_latitude = min(latitude + delta_latitude, 90.0)
+    cos_latitude = math.cos(math.radians(max(abs(min_latitude), abs(max_latitude))))
+    if cos_latitude < 1e-6:
+        return [(min_latitude, max_latitude, -180.0, 180.0)]
+    delta_longitude = delta_latitude / cos_latitude
+    if delta_longitude >= 180.0:
+        return [(min_latitude, max_latitude, -180.0, 180.0)]
+    min_longitude = longitude - delta_longitude
+    max_longitude = longitude + delta_longitude
+    # A box crossing the antimeridian is split into one box on each side.
+    if min_longitude < -180.0:
+        return [
+            (min_latitude, max_latitude, min_longitude + 360.0, 180.0),
+            (min_latitude, max_latitude, -180.0, max_longitude),
+        ]
+    if max_longitude > 180.0:
+        return [
+            (min_latitude, max_latitude, min_longitude, 180.0),
+            (min_latitude, max_latitude, -180.0, max_longitude - 360.0),
+        ]
+    return [(min_latitude, max_latitude, min_longitude, max_longitude)]
+
+
+def covering_cells(
+    min_latitude: float, max_latitude: float, min_longitude: float, max_longitude: float
+) -> list[int] | None:
+    latitude_range = range(
+        math.floor(min_latitude * CELLS_PER_DEGREE),
+        math.floor(max_latitude * CELLS_PER_DEGREE) + 1,
+    )
+    longitude_range = range(
+        math.floor(min_longitude * CELLS_PER_DEGREE),
+        math.floor(max_longitude * CELLS_PER_DEGREE) + 1,
+    )
+    if len(latitude_range) * len(longitude_range) > MAX_CELLS:
+        return None
+    return [
+        (lat + LATITUDE_CELLS // 2) * LONGITUDE_CELLS + lon + LONGITUDE_CELLS // 2
+        for lat in latitude_range
+        for lon in longitude_range
+    ]
+
+
+def distance_km(latitude_column, longitude_column, latitude: float, longitude: float):
+    half_latitude = func.radians(latitude_column - latitude) * 0.5
+    half_longitude = func.radians(longitude_column - longitude) * 0.5
+    haversine = func.power(func.sin(half_latitude), 2) + func.cos(
+        math.radians(latitude)
+    ) * func.cos(func.radians(latitude_column)) * func.power(
+        func.sin(half_longitude), 2
+    )
+    return 2 * EARTH_RADIUS_KM * func.asin(func.sqrt(func.least(haversine, 1.0)))
@@ -10,6 +10,14 @@ from property.infrastructure.postgres.tables import PropertyTable
 
 
 class BaseMapper(ABC):
+    @abstractmethod
+    def to_values(self, entity: BaseEntity) -> dict:
+        pass
+
+    @abstractmethod
+    def to_changes(self, changes: dict) -> dict:
+        pass
+
     @abstractmethod
     def to_table(self, entity: BaseEntity) -> BaseTable:
         pass
@@ -20,8 +28,8 @@ class BaseMapper(ABC):
 
 
 class PropertyMapper(BaseMapper):
-    def to_table(self, entity: Property) -> PropertyTable:
-        return PropertyTable(
+    def to_values(self, entity: Property) -> dict:
+        return dict(
             id=entity.id,
             room_count=entity.room_count,
             bathroom_count=entity.bathroom_count,
@@ -33,9 +41,25 @@ class PropertyMapper(BaseMapper):
             additional_features=entity.additional_features,
         )
 
+    def to_changes(self, changes: dict) -> dict:
+        values = dict(changes)
+        location = values.pop("location", None)
+        if location is not None:
+            values.update(
+                location_address=location["address"],
+                location_latitude=location.get("latitude"),
+                location_longitude=location.get("longitude"),
+            )
+        return values
+
+    def to_table(self, entity: Property) -> PropertyTable:
+        return PropertyTable(**self.to_values(entity))
+
     def to_domain(self, entity: PropertyTable) -> Property:
         return Property(
             id=entity.id,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
             room_count=entity.room_count,
             bathroom_count=entity.bathroom_count,
             location=Location(
@@ -50,17 +74,25 @@ class PropertyMapper(BaseMapper):
 
 
 class ConfigurationMapper(BaseMapper):
-    def to_table(self, entity: Configuration) -> ConfigurationTable:
-        return ConfigurationTable(
+    def to_values(self, entity: Configuration) -> dict:
+        return dict(
             id=entity.id,
             key=entity.key,
             type=entity.type,
             value=entity.value,
         )
 
+    def to_changes(self, changes: dict) -> dict:
+        return dict(changes)
+
+    def to_table(self, entity: Configuration) -> ConfigurationTable:
+        return ConfigurationTable(**self.to_values(entity))
+
     def to_domain(self, entity: ConfigurationTable) -> Configuration:
         return Configuration(
             id=entity.id,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
             key=entity.key,
             type=entity.type,
             value=entity.value,
@@ -0,0 +1,98 @@
+import asyncio
+import inspect
+import logging
+from typing import Awaitable
+from typing import Callable
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresListener:
+    def __init__(
+        self,
+        db_url: str,
+        channel: str,
+        callbacks: list[Callable[[str | None], Awaitable[None] | None]] | None = None,
+        health_check_interval: float = 30,
+        reconnect_delay: float = 1,
+    ):
+        self.dsn = (
+            make_url(db_url)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self.channel = channel
+        self.callbacks = list(callbacks or [])
+        self.health_check_interval = health_check_interval
+        self.reconnect_delay = reconnect_delay
+        self.listening = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._callback_tasks: set[asyncio.Task] = set()
+
+    def subscribe(
+        self, callback: Callable[[str | None], Awaitable[None] | None]
+    ) -> None:
+        self.callbacks.append(callback)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.listening.clear()
+
+    def _notify(self, connection=None, pid=None, channel=None, payload=None) -> None:
+        # Callbacks get no payload when notifications may have been missed.
+        for callback in self.callbacks:
+            try:
+                result = callback(payload)
+            except Exception:
+                logger.exception("Listener callback failed on '%s'", self.channel)
+                continue
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(self._await(result))
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
+
+    async def _await(self, result: Awaitable[None]) -> None:
+        try:
+            await result
+        except Exception:
+            logger.exception("Listener callback failed on '%s'", self.channel)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Listener on '%s' disconnected: %s", self.channel, e)
+            self.listening.clear()
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _listen(self) -> None:
+        connection = await asyncpg.connect(self.dsn)
+        try:
+            await connection.add_listener(self.channel, self._notify)
+            # Anything written while we were not listening has been missed.
+            self._notify()
+            self.listening.set()
+            while not connection.is_closed():
+                await asyncio.sleep(self.health_check_interval)
+                await connection.execute("SELECT 1")
+        finally:
+            if not connection.is_closed():
+                connection.terminate()
@@ -0,0 +1,54 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Column
+
+from property.domain.exceptions import InvalidCursorError
+
+
+CURSOR_TYPES = (datetime, Decimal, UUID, int, float, str)
+
+
+def is_cursor_column(column: Column) -> bool:
+    try:
+        return column.type.python_type in CURSOR_TYPES
+    except NotImplementedError:
+        return False
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (Decimal, UUID)):
+        return str(value)
+    return value
+
+
+def _load_value(column: Column, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type in CURSOR_TYPES:
+        return python_type(value)
+    raise TypeError(f"Column '{column.key}' can not be used in a cursor")
+
+
+def encode_cursor(order_by: str, value: Any, id: UUID) -> str:
+    payload = json.dumps([order_by, _dump_value(value), str(id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str, column: Column) -> tuple[Any, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        cursor_order_by, value, id = json.loads(base64.urlsafe_b64decode(padded))
+        if cursor_order_by != order_by:
+            raise ValueError("Cursor was created for a different ordering")
+        return _load_value(column, value), UUID(id)
+    except (binascii.Error, TypeError, ValueError) as e:
+        raise InvalidCursorError(cursor) from e
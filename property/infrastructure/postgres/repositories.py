@@ -1,85 +1,373 @@
+import json
+import logging
+from datetime import datetime
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Callable
+from typing import Mapping
+from typing import Sequence
+from uuid import UUID
+from uuid import uuid4
+
+from sqlalchemy import Column
+from sqlalchemy import and_
+from sqlalchemy import any_
+from sqlalchemy import case
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import insert
+from sqlalchemy import or_
 from sqlalchemy import select
+from sqlalchemy import tuple_
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import Select
 
+from property.domain.exceptions import InvalidCursorError
+from property.domain.exceptions import RecordNotWrittenError
 from property.domain.interfaces import IBaseRepository
 from property.domain.interfaces import IConfigurationRepository
 from property.domain.interfaces import IPropertyRepository
 from property.domain.filters import BaseFilter
 from property.domain.filters import ConfigurationFilter
 from property.domain.filters import PropertyFilter
+from property.domain.filters import split_feature
 from property.domain.models import BaseEntity
+from property.domain.models import Configuration
+from property.domain.models import Page
+from property.domain.models import Version
 from property.infrastructure.postgres.database import DbConnection
+from property.infrastructure.postgres.geo import bounding_boxes
+from property.infrastructure.postgres.geo import covering_cells
+from property.infrastructure.postgres.geo import distance_km
+from property.infrastructure.postgres.pagination import decode_cursor
+from property.infrastructure.postgres.pagination import encode_cursor
+from property.infrastructure.postgres.pagination import is_cursor_column
+from property.infrastructure.postgres.search import contains_pattern
+from property.infrastructure.postgres.search import prefix_tsquery
 from property.infrastructure.postgres.tables import ConfigurationTable
 from property.infrastructure.postgres.tables import PropertyTable
 from property.infrastructure.postgres.mappers import ConfigurationMapper
 from property.infrastructure.postgres.mappers import PropertyMapper
 
 
+logger = logging.getLogger(__name__)
+
+CONFIGURATION_CHANNEL = "configuration_changed"
+PROPERTY_CHANNEL = "property_changed"
+
+
+def database_error_reason(error: DBAPIError) -> str:
+    # The driver prefixes its messages with the exception class.
+    return str(error.orig).split(": ", 1)[-1].splitlines()[0]
+
+
+def feature_value(value: str) -> int | float | bool | str:
+    try:
+        parsed = json.loads(value)
+    except ValueError:
+        return value
+    return parsed if isinstance(parsed, (int, float, bool)) else value
+
+
 class BaseRepositoryPostgres(IBaseRepository):
+    row_columns: tuple[str, ...] = ()
+    field_columns: dict[str, tuple[str, ...]] = {}
+
     def __init__(self, db_connection: DbConnection):
         super().__init__()
         self.db_connection = db_connection
 
-    async def filter(self, filters: PropertyFilter, query: Select) -> Select:
+    def order_column(self, filters: BaseFilter) -> tuple[Column | None, bool]:
+        if not filters.order_by:
+            return None, False
+        desc = filters.order_by.startswith("-")
+        column = self.table_class.__table__.columns.get(filters.order_by.lstrip("-"))
+        return column, desc
+
+    async def filter(self, filters: BaseFilter, query: Select) -> Select:
+        column, desc = self.order_column(filters)
+        id_column = self.table_class.id
+        if filters.cursor is not None:
+            query = query.where(self.seek(filters, desc))
+        elif filters.offset:
+            query = query.offset(filters.offset)
         if filters.limit:
             query = query.limit(filters.limit)
-        if filters.offset:
-            query = query.offset(filters.offset)
-        if filters.order_by:
-            order_by = filters.order_by
-            desc = order_by.startswith("-")
-            order_by = order_by.lstrip("-")
 
-            column = getattr(self.table_class, order_by, None)
-            if column:
-                query = query.order_by(column.desc() if desc else column)
+        # The id tie-breaker keeps pages stable and lets cursors resume exactly.
+        if column is None:
+            query = query.order_by(*self.default_ordering(filters))
+        elif column is not id_column.expression:
+            query = query.order_by(column.desc() if desc else column)
+        if column is not None or filters.limit:
+            query = query.order_by(id_column.desc() if desc else id_column)
 
         return query
 
-    async def create(self, entity: BaseEntity):
+    def default_ordering(self, filters: BaseFilter) -> list:
+        return []
+
+    def cursor_column(self, filters: BaseFilter) -> Column | None:
+        column, _ = self.order_column(filters)
+        if column is None:
+            if self.default_ordering(filters):
+                return None
+            return self.table_class.id.expression
+        # Only columns whose values survive the JSON round trip can resume a page.
+        if column.nullable or not is_cursor_column(column):
+            return None
+        return column
+
+    def seek(self, filters: BaseFilter, desc: bool):
+        column = self.cursor_column(filters)
+        if column is None:
+            raise InvalidCursorError(filters.cursor)
+        value, last_id = decode_cursor(filters.cursor, column.key, column)
+        if column is self.table_class.id.expression:
+            key, bound = self.table_class.id, last_id
+        else:
+            key, bound = tuple_(column, self.table_class.id), (value, last_id)
+        return key < bound if desc else key > bound
+
+    def next_cursor(self, filters: BaseFilter, rows: list) -> str | None:
+        if not filters.limit or len(rows) < filters.limit:
+            return None
+        column = self.cursor_column(filters)
+        if column is None:
+            return None
+        last = rows[-1]
+        return encode_cursor(column.key, getattr(last, column.key), last.id)
+
+    def id_in(self, ids: list[UUID]):
+        # A single array parameter keeps one statement shape for any number of ids.
+        return self.table_class.id == any_(
+            literal(ids, ARRAY(self.table_class.id.type))
+        )
+
+    def projection(self, filters: BaseFilter) -> list[Column]:
+        columns = self.table_class.__table__.columns
+        names = self.row_columns
+        if filters.fields:
+            # The id and updated_at are always read, cursors, id lookups and
+            # validators depend on them.
+            names = ("id", "updated_at") + tuple(
+                name
+                for field in filters.fields
+                for name in self.field_columns.get(field, (field,))
+                if name not in ("id", "updated_at")
+            )
+        selected = [columns[name] for name in names]
+        # The cursor is built from the last row, so its column must be selected.
+        cursor_column = self.cursor_column(filters)
+        if cursor_column is not None and cursor_column.key not in names:
+            selected.append(cursor_column)
+        return selected
+
+    async def on_write(self, session: AsyncSession, entity: BaseEntity) -> None:
+        pass
+
+    async def on_create_many(
+        self, session: AsyncSession, entities: list[BaseEntity]
+    ) -> None:
+        for entity in entities:
+            await self.on_write(session, entity)
+
+    async def after_commit(self, callback: Callable[[], Awaitable[None] | None]):
+        await self.db_connection.after_commit(callback)
+
+    async def create(self, entity: BaseEntity) -> BaseEntity:
+        values = self.mapper.to_values(entity)
+        if values["id"] is None:
+            values["id"] = uuid4()
+        # Server defaults come back with the INSERT, no refresh is needed.
+        query = insert(self.table_class).values(**values).returning(self.table_class)
         try:
             async with self.db_connection.get_session() as session:
-                table_entity = self.mapper.to_table(entity)
-                session.add(table_entity)
-                await session.commit()
-                await session.refresh(table_entity)
-                return self.mapper.to_domain(table_entity)
+                model = (await session.scalars(query)).one()
+                created = self.mapper.to_domain(model)
+                await self.on_write(session, created)
+                return created
         except Exception as e:
             raise e
 
-    async def list(self, filters: BaseFilter) -> list[BaseEntity]:
+    async def create_many(self, entities: list[BaseEntity]) -> list[BaseEntity]:
+        if not entities:
+            return []
         try:
             async with self.db_connection.get_session() as session:
+                return await self._insert_many(session, entities)
+        except Exception as e:
+            raise e
+
+    async def create_each(
+        self, entities: list[BaseEntity]
+    ) -> list[BaseEntity | BaseException]:
+        if not entities:
+            return []
+        async with self.db_connection.get_session() as session:
+            # Savepoints keep a failed INSERT from aborting the surrounding
+            # transaction, so the rows can be retried one by one.
+            try:
+                async with session.begin_nested():
+                    return await self._insert_many(session, entities)
+            except DBAPIError as e:
+                if len(entities) == 1:
+                    return [RecordNotWrittenError(database_error_reason(e))]
+                logger.warning("Insert of %s rows failed: %s", len(entities), e.orig)
+            results: list[BaseEntity | BaseException] = []
+            for entity in entities:
+                try:
+                    async with session.begin_nested():
+                        results.extend(await self._insert_many(session, [entity]))
+                except DBAPIError as e:
+                    results.append(RecordNotWrittenError(database_error_reason(e)))
+            return results
+
+    async def _insert_many(
+        self, session: AsyncSession, entities: list[BaseEntity]
+    ) -> list[BaseEntity]:
+        values = [self.mapper.to_values(entity) for entity in entities]
+        for row in values:
+            if row["id"] is None:
+                row["id"] = uuid4()
+        # Rows are sent as batched multi-row INSERT ... RETURNING statements.
+        query = insert(self.table_class).returning(
+            self.table_class, sort_by_parameter_order=True
+        )
+        results = await session.scalars(query, values)
+        created = [self.mapper.to_domain(r) for r in results.all()]
+        await self.on_create_many(session, created)
+        return created
+
+    async def copy_many(self, entities: list[BaseEntity]) -> int:
+        if not entities:
+            return 0
+        values = [self.mapper.to_values(entity) for entity in entities]
+        columns = list(values[0].keys())
+        json_columns = {
+            column.key
+            for column in self.table_class.__table__.columns
+            if isinstance(column.type, JSON)
+        }
+        records = []
+        for row in values:
+            if row["id"] is None:
+                row["id"] = uuid4()
+            for key in json_columns.intersection(row):
+                row[key] = json.dumps(row[key])
+            records.append(tuple(row[column] for column in columns))
+        try:
+            async with self.db_connection.get_session() as session:
+                connection = await session.connection()
+                raw_connection = await connection.get_raw_connection()
+                await raw_connection.driver_connection.copy_records_to_table(
+                    self.table_class.__tablename__, records=records, columns=columns
+                )
+                await self.on_create_many(session, entities)
+                return len(records)
+        except Exception as e:
+            raise e
+
+    async def list(
+        self, filters: BaseFilter, primary: bool = False
+    ) -> list[BaseEntity]:
+        page = await self.list_page(filters, primary)
+        return page.items
+
+    async def list_page(
+        self, filters: BaseFilter, primary: bool = False
+    ) -> Page[BaseEntity]:
+        # Reads that must see the latest commit skip the replicas.
+        try:
+            async with self.db_connection.get_session(read_only=not primary) as session:
                 query = select(self.table_class)
                 query = await self.filter(filters, query)
                 results = await session.execute(query)
-                return [self.mapper.to_domain(r) for r in results.scalars().all()]
+                rows = results.scalars().all()
+                return Page(
+                    items=[self.mapper.to_domain(r) for r in rows],
+                    next_cursor=self.next_cursor(filters, rows),
+                )
         except Exception as e:
             raise e
 
-    async def delete(self, entity: BaseEntity) -> None:
+    async def list_rows(
+        self, filters: BaseFilter, primary: bool = False
+    ) -> Page[Mapping]:
+        async with self.db_connection.get_session(read_only=not primary) as session:
+            query = select(*self.projection(filters))
+            query = await self.filter(filters, query)
+            results = await session.execute(query)
+            rows = results.all()
+            return Page.model_construct(
+                items=[row._mapping for row in rows],
+                next_cursor=self.next_cursor(filters, rows),
+            )
+
+    async def version(self, filters: BaseFilter, primary: bool = False) -> Version:
+        table = self.table_class
+        query = await self.filter(filters, select(table.id, table.updated_at))
+        rows = query.subquery()
+        # Only the row count and newest timestamp are read, never the rows.
+        query = select(func.count(), func.max(rows.c.updated_at))
+        async with self.db_connection.get_session(read_only=not primary) as session:
+            count, updated_at = (await session.execute(query)).one()
+            return Version(count=count, updated_at=updated_at)
+
+    async def stream(
+        self, filters: BaseFilter, batch_size: int = 1000
+    ) -> AsyncIterator[BaseEntity]:
+        async with self.db_connection.get_session(read_only=True) as session:
+            query = select(self.table_class)
+            query = await self.filter(filters, query)
+            # Server-side cursor: only one batch of rows is held in memory.
+            results = await session.stream_scalars(
+                query.execution_options(yield_per=batch_size)
+            )
+            async for row in results:
+                yield self.mapper.to_domain(row)
+
+    async def delete(self, id: UUID) -> BaseEntity | None:
+        table = self.table_class
+        query = delete(table).where(table.id == id).returning(table)
         try:
             async with self.db_connection.get_session() as session:
-                table_entity = await session.get(self.table_class, entity.id)
-                if not table_entity:
-                    raise ValueError(f"Record with id {entity.id} not found")
-                await session.delete(table_entity)
-                await session.commit()
+                model = (await session.scalars(query)).one_or_none()
+                if model is None:
+                    return None
+                entity = self.mapper.to_domain(model)
+                await self.on_write(session, entity)
+                return entity
         except Exception as e:
             raise e
 
-    async def update(self, entity: BaseEntity) -> BaseEntity:
+    async def update(
+        self, id: UUID, changes: dict, updated_at_in: Sequence[datetime] | None = None
+    ) -> BaseEntity | None:
+        table = self.table_class
+        values = self.mapper.to_changes(changes)
+        if values:
+            # One round trip: the new row comes back from the UPDATE itself.
+            query = update(table).values(**values).returning(table)
+        else:
+            query = select(table)
+        query = query.where(table.id == id)
+        if updated_at_in is not None:
+            query = query.where(table.updated_at.in_(updated_at_in))
         try:
             async with self.db_connection.get_session() as session:
-                model = await session.get(self.table_class, entity.id)
-                if not model:
-                    raise ValueError(f"Record with id {entity.id} not found")
-
-                for key, value in entity.model_dump(exclude_unset=True).items():
-                    setattr(model, key, value)
-                await session.commit()
-                await session.refresh(model)
-                return self.mapper.to_domain(model)
+                model = (await session.scalars(query)).one_or_none()
+                if model is None:
+                    return None
+                entity = self.mapper.to_domain(model)
+                await self.on_write(session, entity)
+                return entity
         except Exception as e:
             raise e
 
@@ -87,24 +375,180 @@ class BaseRepositoryPostgres(IBaseRepository):
 class PropertyRepositoryPostgres(IPropertyRepository, BaseRepositoryPostgres):
     mapper = PropertyMapper()
     table_class = PropertyTable
+    row_columns = (
+        "id",
+        "property_type",
+        "room_count",
+        "bathroom_count",
+        "additional_features",
+        "location_address",
+        "location_latitude",
+        "location_longitude",
+        "rent_value",
+        "updated_at",
+    )
+    field_columns = {
+        "location": ("location_address", "location_latitude", "location_longitude"),
+    }
+
+    def __init__(self, db_connection: DbConnection, trigram_search: bool = True):
+        super().__init__(db_connection)
+        self.trigram_search = trigram_search
+
+    async def on_write(self, session: AsyncSession, entity: BaseEntity) -> None:
+        # Delivered to listeners only when the transaction commits.
+        await session.execute(select(func.pg_notify(PROPERTY_CHANNEL, str(entity.id))))
+
+    async def on_create_many(
+        self, session: AsyncSession, entities: list[BaseEntity]
+    ) -> None:
+        # New rows only change lists, one notification without an id drops them.
+        await session.execute(select(func.pg_notify(PROPERTY_CHANNEL, "")))
 
     async def filter(self, filters: PropertyFilter, query: Select) -> Select:
         query = await super().filter(filters, query)
+        table = self.table_class
         if filters.id_eq is not None:
-            query = query.where(self.table_class.id == filters.id_eq)
+            query = query.where(table.id == filters.id_eq)
+        if filters.id_in is not None:
+            query = query.where(self.id_in(filters.id_in))
+        if filters.property_type_eq is not None:
+            query = query.where(table.property_type == filters.property_type_eq)
+        if filters.property_type_in is not None:
+            query = query.where(table.property_type.in_(filters.property_type_in))
+        if filters.rent_value_gte is not None:
+            query = query.where(table.rent_value >= filters.rent_value_gte)
+        if filters.rent_value_lte is not None:
+            query = query.where(table.rent_value <= filters.rent_value_lte)
+        if filters.room_count_gte is not None:
+            query = query.where(table.room_count >= filters.room_count_gte)
+        if filters.room_count_lte is not None:
+            query = query.where(table.room_count <= filters.room_count_lte)
+        if filters.bathroom_count_gte is not None:
+            query = query.where(table.bathroom_count >= filters.bathroom_count_gte)
+        if filters.bathroom_count_lte is not None:
+            query = query.where(table.bathroom_count <= filters.bathroom_count_lte)
+        if filters.updated_at_gte is not None:
+            query = query.where(table.updated_at >= filters.updated_at_gte)
+        if filters.updated_at_lte is not None:
+            query = query.where(table.updated_at <= filters.updated_at_lte)
+        query = self.filter_features(filters, query)
+        query = self.filter_location(filters, query)
+        return self.filter_search(filters, query)
+
+    def distance(self, filters: PropertyFilter):
+        return distance_km(
+            self.table_class.location_latitude,
+            self.table_class.location_longitude,
+            filters.near_lat,
+            filters.near_lon,
+        )
+
+    def default_ordering(self, filters: PropertyFilter) -> list:
+        if filters.is_near:
+            return [self.distance(filters)]
+        if not filters.q:
+            return []
+        rank = None
+        tsquery = prefix_tsquery(filters.q)
+        if tsquery is not None:
+            rank = func.ts_rank(self.table_class.location_search, tsquery)
+        if self.trigram_search:
+            similarity = func.word_similarity(
+                filters.q, self.table_class.location_address
+            )
+            rank = similarity if rank is None else rank + similarity
+        return [] if rank is None else [rank.desc()]
+
+    def filter_search(self, filters: PropertyFilter, query: Select) -> Select:
+        if not filters.q:
+            return query
+        table = self.table_class
+        # ILIKE and %> are served by the trigram index, @@ by the tsvector index.
+        conditions = [table.location_address.ilike(contains_pattern(filters.q))]
+        if self.trigram_search:
+            # Matches addresses containing a word similar to q, so typos still hit.
+            conditions.append(table.location_address.op("%>")(filters.q))
+        tsquery = prefix_tsquery(filters.q)
+        if tsquery is not None:
+            conditions.append(table.location_search.op("@@")(tsquery))
+        return query.where(or_(*conditions))
+
+    def filter_location(self, filters: PropertyFilter, query: Select) -> Select:
+        table = self.table_class
+        regions = []
+        if filters.is_near:
+            regions.append(
+                bounding_boxes(filters.near_lat, filters.near_lon, filters.radius_km)
+            )
+            query = query.where(self.distance(filters) <= filters.radius_km)
+        if filters.is_bounding_box:
+            regions.append(
+                [(filters.min_lat, filters.max_lat, filters.min_lon, filters.max_lon)]
+            )
+        for boxes in regions:
+            # The grid cell lookup is the indexed part, the ranges make it exact.
+            cells = [covering_cells(*box) for box in boxes]
+            if None not in cells:
+                query = query.where(table.location_cell.in_(sum(cells, [])))
+            query = query.where(
+                or_(
+                    *(
+                        and_(
+                            table.location_latitude.between(min_lat, max_lat),
+                            table.location_longitude.between(min_lon, max_lon),
+                        )
+                        for min_lat, max_lat, min_lon, max_lon in boxes
+                    )
+                )
+            )
+        return query
+
+    def feature_number(self, key: str):
+        feature = self.table_class.additional_features[key]
+        # Non numeric values compare as NULL instead of failing the cast.
+        return case(
+            (func.jsonb_typeof(feature) == "number", feature.as_float()),
+            else_=None,
+        )
+
+    def filter_features(self, filters: PropertyFilter, query: Select) -> Select:
+        features = self.table_class.additional_features
+        # @> and ? are served by the GIN index on additional_features.
+        for item in filters.feature_eq or []:
+            key, value = split_feature(item)
+            candidates = {value, feature_value(value)}
+            query = query.where(
+                or_(*(features.contains({key: candidate}) for candidate in candidates))
+            )
+        if filters.feature_exists:
+            query = query.where(features.has_all(array(filters.feature_exists)))
+        for item in filters.feature_gte or []:
+            key, value = split_feature(item)
+            query = query.where(self.feature_number(key) >= float(value))
+        for item in filters.feature_lte or []:
+            key, value = split_feature(item)
+            query = query.where(self.feature_number(key) <= float(value))
         return query
 
 
 class ConfigurationRepositoryPostgres(IConfigurationRepository, BaseRepositoryPostgres):
     mapper = ConfigurationMapper()
     table_class = ConfigurationTable
+    row_columns = ("id", "key", "type", "value", "updated_at")
 
     async def filter(self, filters: ConfigurationFilter, query: Select) -> Select:
         query = await super().filter(filters, query)
         if filters.id_eq is not None:
             query = query.where(self.table_class.id == filters.id_eq)
+        if filters.id_in is not None:
+            query = query.where(self.id_in(filters.id_in))
         if filters.key_eq is not None:
             query = query.where(self.table_class.key == filters.key_eq)
         if filters.key_in is not None:
             query = query.where(self.table_class.key.in_(filters.key_in))
         return query
+
+    async def on_write(self, session: AsyncSession, entity: Configuration) -> None:
+        # Delivered to listeners only when the transaction commits.
+        await session.execute(select(func.pg_notify(CONFIGURATION_CHANNEL, entity.key)))
@@ -0,0 +1,22 @@
+import re
+
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy.dialects.postgresql import REGCONFIG
+
+
+SEARCH_CONFIGURATION = "simple"
+
+
+def prefix_tsquery(text: str):
+    terms = re.findall(r"\w+", text.lower())
+    if not terms:
+        return None
+    # Every term matches as a prefix so partially typed words still hit.
+    query = " & ".join(f"{term}:*" for term in terms)
+    return func.to_tsquery(literal(SEARCH_CONFIGURATION, REGCONFIG), query)
+
+
+def contains_pattern(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
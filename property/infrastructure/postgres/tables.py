@@ -2,18 +2,32 @@ from uuid import uuid4
 from datetime import datetime
 from decimal import Decimal
 
+from sqlalchemy import Computed
 from sqlalchemy import DateTime
 from sqlalchemy import Float
+from sqlalchemy import Index
 from sqlalchemy import DECIMAL
 from sqlalchemy import Integer
 from sqlalchemy import String
 from sqlalchemy import func
+from sqlalchemy import text
 from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import mapped_column
 from sqlalchemy.orm import Mapped
 
+from property.infrastructure.postgres.geo import CELL_EXPRESSION
+from property.infrastructure.postgres.search import SEARCH_CONFIGURATION
+
+
+def has_trigram(ddl, target, bind, **kwargs) -> bool:
+    # The migrations install pg_trgm, create_all skips the index without it.
+    query = text("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')")
+    return bind.scalar(query)
+
 
 class BaseTable(DeclarativeBase):
     __abstract__ = True
@@ -34,18 +48,53 @@ class BaseTable(DeclarativeBase):
 
 class PropertyTable(BaseTable):
     __tablename__ = "property"
+    __table_args__ = (
+        Index("ix_property_property_type_rent_value", "property_type", "rent_value"),
+        Index("ix_property_rent_value_id", "rent_value", "id"),
+        Index("ix_property_room_count_bathroom_count", "room_count", "bathroom_count"),
+        Index("ix_property_updated_at_id", "updated_at", "id"),
+        Index("ix_property_created_at_id", "created_at", "id"),
+        Index("ix_property_location_cell", "location_cell"),
+        Index("ix_property_location_search", "location_search", postgresql_using="gin"),
+        Index(
+            "ix_property_location_address_trgm",
+            "location_address",
+            postgresql_using="gin",
+            postgresql_ops={"location_address": "gin_trgm_ops"},
+        ).ddl_if(callable_=has_trigram),
+        Index(
+            "ix_property_location_latitude_longitude",
+            "location_latitude",
+            "location_longitude",
+        ),
+        Index(
+            "ix_property_additional_features",
+            "additional_features",
+            postgresql_using="gin",
+        ),
+    )
 
     room_count: Mapped[int] = mapped_column(Integer, nullable=False)
     bathroom_count: Mapped[int] = mapped_column(Integer, nullable=False)
     location_address: Mapped[str] = mapped_column(String, nullable=False)
     location_latitude: Mapped[float] = mapped_column(Float, nullable=True)
     location_longitude: Mapped[float] = mapped_column(Float, nullable=True)
+    location_search: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"to_tsvector('{SEARCH_CONFIGURATION}', coalesce(location_address, ''))",
+            persisted=True,
+        ),
+    )
+    location_cell: Mapped[int] = mapped_column(
+        Integer, Computed(CELL_EXPRESSION, persisted=True), nullable=True
+    )
     rent_value: Mapped[Decimal] = mapped_column(
         DECIMAL(precision=10, scale=2), nullable=False
     )
 
     property_type: Mapped[str] = mapped_column(String, nullable=False)
-    additional_features: Mapped[dict] = mapped_column(JSON, default=list)
+    additional_features: Mapped[dict] = mapped_column(JSONB, default=dict)
 
 
 class ConfigurationTable(BaseTable):
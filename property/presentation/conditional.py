@@ -0,0 +1,118 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from email.utils import format_datetime
+from email.utils import parsedate_to_datetime
+
+from fastapi import Request
+from fastapi import Response
+from fastapi import status
+
+from property.domain.models import Version
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+# OpenAPI descriptions of the validator headers sent and honoured by the routes.
+VALIDATOR_HEADERS = {
+    "ETag": {
+        "description": "Version of the returned content",
+        "schema": {"type": "string"},
+    },
+    "Last-Modified": {
+        "description": "When the returned rows last changed, absent on lists",
+        "schema": {"type": "string"},
+    },
+}
+
+
+def _header_parameter(name: str, description: str) -> dict:
+    return {
+        "name": name,
+        "in": "header",
+        "required": False,
+        "description": description,
+        "schema": {"type": "string"},
+    }
+
+
+CONDITIONAL_GET_PARAMETERS = [
+    _header_parameter("If-None-Match", "Answer 304 when an ETag still matches"),
+    _header_parameter(
+        "If-Modified-Since",
+        "Answer 304 when unchanged since this date, ignored on lists",
+    ),
+]
+IF_MATCH_PARAMETERS = [
+    _header_parameter("If-Match", "Answer 412 unless the ETag still matches"),
+]
+
+
+def etag(version: Version) -> str:
+    if version.digest is not None:
+        return f'"{version.count}-{version.digest}"'
+    micros = (version.updated_at - EPOCH) // MICROSECOND if version.updated_at else 0
+    return f'"{version.count}-{micros}"'
+
+
+def _parse_etags(header: str) -> list[str]:
+    return [tag.strip().removeprefix("W/") for tag in header.split(",") if tag.strip()]
+
+
+def validators(version: Version) -> dict[str, str]:
+    headers = {"ETag": etag(version)}
+    if version.updated_at is not None and version.digest is None:
+        headers["Last-Modified"] = format_datetime(
+            version.updated_at.astimezone(timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, version: Version) -> bool:
+    # If-None-Match wins over If-Modified-Since when both are sent.
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = _parse_etags(if_none_match)
+        return "*" in tags or etag(version) in tags
+    # A collection's newest timestamp does not move when a row is deleted.
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or version.updated_at is None or version.digest:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    # HTTP dates have second precision.
+    return version.updated_at.replace(microsecond=0) <= since
+
+
+def not_modified(version: Version) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=validators(version)
+    )
+
+
+def if_match(request: Request) -> list[datetime] | None:
+    header = request.headers.get("if-match")
+    if header is None:
+        return None
+    tags = [tag.strip() for tag in header.split(",")]
+    if "*" in tags:
+        return None
+    # Only the timestamp is compared, so the update can check it atomically.
+    # Weak tags never match If-Match.
+    timestamps = []
+    for tag in tags:
+        if tag.startswith("W/"):
+            continue
+        _, _, micros = tag.strip('"').partition("-")
+        if micros.isdigit():
+            timestamps.append(EPOCH + int(micros) * MICROSECOND)
+    return timestamps
@@ -1,8 +1,16 @@
 from fastapi import APIRouter
 from fastapi import status
 from fastapi import Depends
+from fastapi import Query
+from fastapi import Request
+from fastapi import Response
+from fastapi.exceptions import RequestValidationError
+from typing import Annotated
 from uuid import UUID
 
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
 from dependency_injector.wiring import inject
 from dependency_injector.wiring import Provide
 
@@ -12,75 +20,170 @@ from property.application.dtos import ConfigurationCreateRequest
 from property.application.dtos import ConfigurationUpdateRequest
 from property.application.exceptions import ExceptionResponse
 from property.application.services import ConfigurationService
+from property.presentation.conditional import CONDITIONAL_GET_PARAMETERS
+from property.presentation.conditional import IF_MATCH_PARAMETERS
+from property.presentation.conditional import VALIDATOR_HEADERS
+from property.presentation.conditional import if_match
+from property.presentation.conditional import is_conditional
+from property.presentation.conditional import is_not_modified
+from property.presentation.conditional import not_modified
+from property.presentation.conditional import validators
+from property.presentation.dependencies import unit_of_work
+from property.presentation.pagination import NEXT_CURSOR_HEADERS
+from property.presentation.pagination import paginate
+from property.presentation.responses import render
 from property.domain.filters import ConfigurationFilter
 
 
 router = APIRouter(prefix="/api/properties/settings", tags=["Configurations"])
 
+configuration_adapter = TypeAdapter(ConfigurationOutput)
+configuration_list_adapter = TypeAdapter(list[ConfigurationOutput])
+
+
+async def configuration_filters(
+    filters: Annotated[ConfigurationFilter, Query()],
+) -> ConfigurationFilter:
+    return filters
+
+
+async def configuration_fields(
+    fields: Annotated[list[str] | None, Query()] = None,
+) -> list[str] | None:
+    try:
+        return ConfigurationFilter(fields=fields).fields
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
 
 @router.post(
     "/",
     responses={
-        status.HTTP_201_CREATED: {"model": ConfigurationOutput},
+        status.HTTP_201_CREATED: {
+            "model": ConfigurationOutput,
+            "headers": VALIDATOR_HEADERS,
+        },
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_201_CREATED,
 )
 @inject
 async def create_configuration(
     create_request: ConfigurationCreateRequest,
+    response: Response,
     service: ConfigurationService = Depends(Provide[Container.configuration_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
 ):
-    return await service.create_configuration(create_request)
+    output, version = await service.create_configuration(create_request)
+    response.headers.update(validators(version))
+    return render(
+        output,
+        configuration_adapter,
+        fast_json,
+        response,
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
 @router.get(
     "/",
     responses={
-        status.HTTP_200_OK: {"model": list[ConfigurationOutput]},
+        status.HTTP_200_OK: {
+            "model": list[ConfigurationOutput],
+            "headers": {**VALIDATOR_HEADERS, **NEXT_CURSOR_HEADERS},
+        },
+        status.HTTP_304_NOT_MODIFIED: {"headers": VALIDATOR_HEADERS},
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_200_OK,
+    openapi_extra={"parameters": CONDITIONAL_GET_PARAMETERS},
 )
 @inject
 async def list_configurations(
-    filters: ConfigurationFilter = Depends(),
+    request: Request,
+    response: Response,
+    filters: ConfigurationFilter = Depends(configuration_filters),
     service: ConfigurationService = Depends(Provide[Container.configuration_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
 ):
-    return await service.list_configurations(filters)
+    # The page keys are only read to answer a conditional request without it.
+    if is_conditional(request):
+        version = await service.list_configurations_version(filters)
+        if is_not_modified(request, version):
+            return not_modified(version)
+    page, version = await service.list_configurations(filters)
+    response.headers.update(validators(version))
+    items = paginate(response, page)
+    return render(
+        items,
+        configuration_list_adapter,
+        fast_json,
+        response,
+        exclude_unset=filters.fields is not None,
+    )
 
 
 @router.get(
     "/{property_id}",
     responses={
-        status.HTTP_200_OK: {"model": ConfigurationOutput},
+        status.HTTP_200_OK: {
+            "model": ConfigurationOutput,
+            "headers": VALIDATOR_HEADERS,
+        },
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_200_OK,
 )
 @inject
 async def get_configuration(
     property_id: UUID,
+    response: Response,
+    fields: list[str] | None = Depends(configuration_fields),
     service: ConfigurationService = Depends(Provide[Container.configuration_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
 ):
-    return await service.get_configuration_by_id(property_id)
+    output, version = await service.get_configuration_by_id(property_id, fields)
+    response.headers.update(validators(version))
+    return render(
+        output,
+        configuration_adapter,
+        fast_json,
+        response,
+        exclude_unset=fields is not None,
+    )
 
 
 @router.put(
     "/{property_id}",
     responses={
-        status.HTTP_200_OK: {"model": ConfigurationOutput},
+        status.HTTP_200_OK: {
+            "model": ConfigurationOutput,
+            "headers": VALIDATOR_HEADERS,
+        },
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
+        status.HTTP_412_PRECONDITION_FAILED: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_200_OK,
+    openapi_extra={"parameters": IF_MATCH_PARAMETERS},
 )
 @inject
 async def update_configuration(
     property_id: UUID,
     update_request: ConfigurationUpdateRequest,
+    request: Request,
+    response: Response,
     service: ConfigurationService = Depends(Provide[Container.configuration_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
 ):
-    return await service.update_configuration(property_id, update_request)
+    output, version = await service.update_configuration(
+        property_id, update_request, if_match(request)
+    )
+    response.headers.update(validators(version))
+    return render(output, configuration_adapter, fast_json, response)
 
 
 @router.delete(
@@ -89,6 +192,7 @@ async def update_configuration(
         status.HTTP_204_NO_CONTENT: {},
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_204_NO_CONTENT,
 )
 @inject
@@ -0,0 +1,23 @@
+from fastapi import Depends
+
+from dependency_injector.wiring import inject
+from dependency_injector.wiring import Provide
+
+from property.settings import Container
+from property.infrastructure.postgres.database import DbConnection
+
+
+@inject
+async def get_db_connection(
+    db_connection: DbConnection = Depends(Provide[Container.db_connection]),
+) -> DbConnection:
+    return db_connection
+
+
+# Not wrapped with @inject: the wrapper would swallow the exception FastAPI
+# throws into the generator, leaving the transaction open.
+async def unit_of_work(db_connection: DbConnection = Depends(get_db_connection)):
+    # Every repository call of the request shares this session and transaction,
+    # committed when the endpoint returns and rolled back if it raises.
+    async with db_connection.unit_of_work():
+        yield
@@ -0,0 +1,79 @@
+from fastapi import APIRouter
+from fastapi import status
+from fastapi import Depends
+
+from dependency_injector.wiring import inject
+from dependency_injector.wiring import Provide
+
+from property.application.coalescing import SingleFlight
+from property.application.coalescing import SingleFlightStatistics
+from property.application.group_commit import GroupCommitBuffer
+from property.application.group_commit import GroupCommitStatistics
+from property.application.response_cache import CacheStatistics
+from property.application.response_cache import ResponseCache
+from property.settings import Container
+from property.infrastructure.postgres.database import DbConnection
+from property.infrastructure.postgres.database import PoolStatistics
+
+
+router = APIRouter(prefix="/api/health", tags=["Health"])
+
+
+@router.get(
+    "/database",
+    responses={
+        status.HTTP_200_OK: {"model": PoolStatistics},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_database_pool(
+    db_connection: DbConnection = Depends(Provide[Container.db_connection]),
+):
+    return db_connection.pool_stats()
+
+
+@router.get(
+    "/cache",
+    responses={
+        status.HTTP_200_OK: {"model": CacheStatistics},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_response_cache(
+    response_cache: ResponseCache | None = Depends(
+        Provide[Container.property_response_cache]
+    ),
+):
+    if response_cache is None:
+        return CacheStatistics(enabled=False)
+    return response_cache.stats()
+
+
+@router.get(
+    "/coalescing",
+    responses={
+        status.HTTP_200_OK: {"model": SingleFlightStatistics},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_request_coalescing(
+    single_flight: SingleFlight = Depends(Provide[Container.property_single_flight]),
+):
+    return single_flight.stats()
+
+
+@router.get(
+    "/group-commit",
+    responses={
+        status.HTTP_200_OK: {"model": GroupCommitStatistics},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_group_commit(
+    write_buffer: GroupCommitBuffer = Depends(Provide[Container.property_write_buffer]),
+):
+    return write_buffer.stats()
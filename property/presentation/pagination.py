@@ -0,0 +1,19 @@
+from fastapi import Response
+
+from property.domain.models import Page
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+NEXT_CURSOR_HEADERS = {
+    NEXT_CURSOR_HEADER: {
+        "description": "Cursor of the next page, absent on the last page",
+        "schema": {"type": "string"},
+    }
+}
+
+
+def paginate(response: Response, page: Page) -> list:
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
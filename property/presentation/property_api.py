@@ -1,22 +1,70 @@
 from fastapi import APIRouter
 from fastapi import status
 from fastapi import Depends
+from fastapi import Query
+from fastapi import Request
+from fastapi import Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
+from typing import Annotated
 from uuid import UUID
 
+from pydantic import TypeAdapter
+from pydantic import ValidationError
+
 from dependency_injector.wiring import inject
 from dependency_injector.wiring import Provide
 
 from property.settings import Container
+from property.application.dtos import PropertyBatchGetOutput
+from property.application.dtos import PropertyBatchGetRequest
+from property.application.dtos import PropertyBulkOutput
+from property.application.dtos import PropertyImportOutput
 from property.application.dtos import PropertyOutput
 from property.application.dtos import PropertyCreateRequest
 from property.application.dtos import PropertyUpdateRequest
 from property.application.exceptions import ExceptionResponse
+from property.application.importers import PropertyImporter
 from property.application.services import PropertyService
+from property.presentation.conditional import CONDITIONAL_GET_PARAMETERS
+from property.presentation.conditional import IF_MATCH_PARAMETERS
+from property.presentation.conditional import VALIDATOR_HEADERS
+from property.presentation.conditional import if_match
+from property.presentation.conditional import is_conditional
+from property.presentation.conditional import is_not_modified
+from property.presentation.conditional import not_modified
+from property.presentation.conditional import validators
+from property.presentation.dependencies import unit_of_work
+from property.presentation.pagination import NEXT_CURSOR_HEADERS
+from property.presentation.pagination import paginate
+from property.presentation.responses import render
+from property.domain.enums import ExportFormat
 from property.domain.filters import PropertyFilter
 
 
 router = APIRouter(prefix="/api/properties", tags=["Properties"])
 
+property_adapter = TypeAdapter(PropertyOutput)
+property_list_adapter = TypeAdapter(list[PropertyOutput])
+property_bulk_adapter = TypeAdapter(PropertyBulkOutput)
+property_batch_get_adapter = TypeAdapter(PropertyBatchGetOutput)
+
+
+async def property_filters(
+    filters: Annotated[PropertyFilter, Query()],
+) -> PropertyFilter:
+    return filters
+
+
+async def property_fields(
+    fields: Annotated[list[str] | None, Query()] = None,
+) -> list[str] | None:
+    try:
+        return PropertyFilter(fields=fields).fields
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+
 
 @router.post(
     "/",
@@ -24,63 +72,263 @@ router = APIRouter(prefix="/api/properties", tags=["Properties"])
         status.HTTP_201_CREATED: {"model": PropertyOutput},
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_201_CREATED,
 )
 @inject
 async def create_property(
     create_request: PropertyCreateRequest,
     service: PropertyService = Depends(Provide[Container.property_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
+):
+    output = await service.create_property(create_request)
+    return render(
+        output, property_adapter, fast_json, status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.post(
+    "/bulk",
+    responses={
+        status.HTTP_200_OK: {"model": PropertyBulkOutput},
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
+    },
+    dependencies=[Depends(unit_of_work, scope="function")],
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def create_properties(
+    create_requests: list[PropertyCreateRequest],
+    service: PropertyService = Depends(Provide[Container.property_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
+):
+    output = await service.create_properties(create_requests)
+    return render(output, property_bulk_adapter, fast_json)
+
+
+@router.post(
+    "/batch-get",
+    responses={
+        status.HTTP_200_OK: {"model": PropertyBatchGetOutput},
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
+    },
+    dependencies=[Depends(unit_of_work, scope="function")],
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def batch_get_properties(
+    batch_request: PropertyBatchGetRequest,
+    service: PropertyService = Depends(Provide[Container.property_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
 ):
-    return await service.create_property(create_request)
+    output = await service.batch_get_properties(batch_request)
+    return render(output, property_batch_get_adapter, fast_json)
 
 
 @router.get(
     "/",
     responses={
-        status.HTTP_200_OK: {"model": list[PropertyOutput]},
+        status.HTTP_200_OK: {
+            "model": list[PropertyOutput],
+            "headers": NEXT_CURSOR_HEADERS,
+        },
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_200_OK,
 )
 @inject
 async def list_properties(
-    filters: PropertyFilter = Depends(),
+    response: Response,
+    filters: PropertyFilter = Depends(property_filters),
+    service: PropertyService = Depends(Provide[Container.property_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
+):
+    page = await service.list_properties(filters)
+    items = paginate(response, page)
+    return render(
+        items,
+        property_list_adapter,
+        fast_json,
+        response,
+        exclude_unset=filters.fields is not None,
+    )
+
+
+@router.get(
+    "/export",
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        },
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
+    },
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def export_properties(
+    filters: PropertyFilter = Depends(property_filters),
+    format: ExportFormat = ExportFormat.NDJSON,
     service: PropertyService = Depends(Provide[Container.property_service]),
 ):
-    return await service.list_properties(filters)
+    media_type = "text/csv" if format == ExportFormat.CSV else "application/x-ndjson"
+    return StreamingResponse(
+        service.export_properties(filters, format),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="properties.{format.value}"'
+        },
+    )
+
+
+def with_errors_url(
+    request: Request, importer: PropertyImporter, report: PropertyImportOutput
+) -> PropertyImportOutput:
+    if importer.get_import_errors(report.id) is None:
+        return report
+    errors_url = request.url_for("get_import_errors", import_id=report.id)
+    return report.model_copy(update={"errors_url": str(errors_url)})
+
+
+@router.post(
+    "/imports",
+    responses={
+        status.HTTP_201_CREATED: {"model": PropertyImportOutput},
+        status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
+    },
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+        }
+    },
+)
+@inject
+async def import_properties(
+    request: Request,
+    format: ExportFormat = ExportFormat.NDJSON,
+    importer: PropertyImporter = Depends(Provide[Container.property_importer]),
+):
+    # The report is returned once the import finishes, until then its progress
+    # is only visible through GET /imports.
+    report = await importer.import_properties(request.stream(), format)
+    return with_errors_url(request, importer, report)
+
+
+@router.get(
+    "/imports",
+    responses={
+        status.HTTP_200_OK: {"model": list[PropertyImportOutput]},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def list_imports(
+    request: Request,
+    importer: PropertyImporter = Depends(Provide[Container.property_importer]),
+):
+    return [
+        with_errors_url(request, importer, report) for report in importer.list_imports()
+    ]
+
+
+@router.get(
+    "/imports/{import_id}",
+    responses={
+        status.HTTP_200_OK: {"model": PropertyImportOutput},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionResponse},
+    },
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_import(
+    request: Request,
+    import_id: UUID,
+    importer: PropertyImporter = Depends(Provide[Container.property_importer]),
+):
+    report = importer.get_import(str(import_id))
+    return with_errors_url(request, importer, report)
+
+
+@router.get(
+    "/imports/{import_id}/errors",
+    responses={
+        status.HTTP_200_OK: {"content": {"application/x-ndjson": {}}},
+        status.HTTP_404_NOT_FOUND: {"model": ExceptionResponse},
+    },
+    response_class=FileResponse,
+    status_code=status.HTTP_200_OK,
+)
+@inject
+async def get_import_errors(
+    import_id: UUID,
+    importer: PropertyImporter = Depends(Provide[Container.property_importer]),
+):
+    error_file = importer.get_import_errors(str(import_id))
+    if error_file is None:
+        return Response(content=b"", media_type="application/x-ndjson")
+    return FileResponse(error_file, media_type="application/x-ndjson")
 
 
 @router.get(
     "/{property_id}",
     responses={
-        status.HTTP_200_OK: {"model": PropertyOutput},
+        status.HTTP_200_OK: {"model": PropertyOutput, "headers": VALIDATOR_HEADERS},
+        status.HTTP_304_NOT_MODIFIED: {"headers": VALIDATOR_HEADERS},
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_200_OK,
+    openapi_extra={"parameters": CONDITIONAL_GET_PARAMETERS},
 )
 @inject
 async def get_property(
     property_id: UUID,
+    request: Request,
+    response: Response,
+    fields: list[str] | None = Depends(property_fields),
     service: PropertyService = Depends(Provide[Container.property_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
 ):
-    return await service.get_property_by_id(property_id)
+    # The aggregate is only read to answer a conditional request without the row.
+    if is_conditional(request):
+        version = await service.get_property_version(property_id)
+        if version.count and is_not_modified(request, version):
+            return not_modified(version)
+    output, version = await service.get_property_by_id(property_id, fields)
+    response.headers.update(validators(version))
+    return render(
+        output, property_adapter, fast_json, response, exclude_unset=fields is not None
+    )
 
 
 @router.put(
     "/{property_id}",
     responses={
-        status.HTTP_200_OK: {"model": PropertyOutput},
+        status.HTTP_200_OK: {"model": PropertyOutput, "headers": VALIDATOR_HEADERS},
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
+        status.HTTP_412_PRECONDITION_FAILED: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_200_OK,
+    openapi_extra={"parameters": IF_MATCH_PARAMETERS},
 )
 @inject
 async def update_property(
     property_id: UUID,
     update_request: PropertyUpdateRequest,
+    request: Request,
+    response: Response,
     service: PropertyService = Depends(Provide[Container.property_service]),
+    fast_json: bool = Depends(Provide[Container.config.FAST_JSON_RESPONSES]),
 ):
-    return await service.update_property(property_id, update_request)
+    output, version = await service.update_property(
+        property_id, update_request, if_match(request)
+    )
+    response.headers.update(validators(version))
+    return render(output, property_adapter, fast_json, response)
 
 
 @router.delete(
@@ -89,6 +337,7 @@ async def update_property(
         status.HTTP_204_NO_CONTENT: {},
         status.HTTP_400_BAD_REQUEST: {"model": ExceptionResponse},
     },
+    dependencies=[Depends(unit_of_work, scope="function")],
     status_code=status.HTTP_204_NO_CONTENT,
 )
 @inject
@@ -0,0 +1,32 @@
+from typing import Any
+
+from fastapi import Response
+from fastapi import status
+from pydantic import TypeAdapter
+
+
+class FastJSONResponse(Response):
+    media_type = "application/json"
+
+
+def render(
+    content: Any,
+    adapter: TypeAdapter,
+    fast_json: bool,
+    response: Response | None = None,
+    status_code: int = status.HTTP_200_OK,
+    exclude_unset: bool = False,
+) -> Any:
+    if not fast_json:
+        if exclude_unset:
+            # Sparse outputs leave unrequested fields unset.
+            return adapter.dump_python(content, mode="json", exclude_unset=True)
+        return content
+    # Outputs are already validated, so they are dumped straight to bytes
+    # instead of going through jsonable_encoder.
+    headers = dict(response.headers) if response is not None else None
+    return FastJSONResponse(
+        adapter.dump_json(content, exclude_unset=exclude_unset),
+        status_code=status_code,
+        headers=headers,
+    )
@@ -2,9 +2,18 @@ from dependency_injector import providers
 from dependency_injector.containers import DeclarativeContainer, WiringConfiguration
 from pydantic_settings import BaseSettings
 
+from property.application.cache import ConfigurationCache
+from property.application.coalescing import SingleFlight
+from property.application.group_commit import GroupCommitBuffer
+from property.application.importers import PropertyImporter
 from property.application.services import PropertyService
 from property.application.services import ConfigurationService
+from property.application.response_cache import InMemoryCacheBackend
+from property.application.response_cache import ResponseCache
 from property.infrastructure.postgres.database import DbConnection
+from property.infrastructure.postgres.notifications import PostgresListener
+from property.infrastructure.postgres.repositories import CONFIGURATION_CHANNEL
+from property.infrastructure.postgres.repositories import PROPERTY_CHANNEL
 from property.infrastructure.postgres.repositories import (
     ConfigurationRepositoryPostgres,
 )
@@ -13,6 +22,30 @@ from property.infrastructure.postgres.repositories import PropertyRepositoryPost
 
 class Settings(BaseSettings):
     DATABASE_URL: str
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = False
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_WARMUP: int = 5
+    DATABASE_REPLICA_URLS: list[str] = []
+    DATABASE_REPLICA_RETRY_INTERVAL: float = 10
+    DATABASE_REPLICA_MAX_LAG: float = 5
+    DATABASE_REPLICA_HEALTH_CHECK_INTERVAL: float = 5
+    DATABASE_READ_YOUR_WRITES: bool = True
+    SEARCH_TRIGRAM: bool = True
+    CONFIGURATION_CACHE_TTL: float = 60
+    CONFIGURATION_LISTENER_HEALTH_CHECK_INTERVAL: float = 30
+    IMPORT_BATCH_SIZE: int = 1000
+    IMPORT_DIR: str | None = None
+    FAST_JSON_RESPONSES: bool = False
+    RESPONSE_CACHE_BACKEND: str = "none"
+    RESPONSE_CACHE_TTL: float = 30
+    RESPONSE_CACHE_MAX_SIZE: int = 10000
+    REQUEST_COALESCING: bool = True
+    GROUP_COMMIT: bool = False
+    GROUP_COMMIT_MAX_DELAY: float = 0.01
+    GROUP_COMMIT_MAX_BATCH_SIZE: int = 100
 
     class Config:
         env_file = ".env"
@@ -26,25 +59,107 @@ class Container(DeclarativeContainer):
 
     config = providers.Configuration()
 
-    db_connection = providers.Singleton(DbConnection, config.DATABASE_URL)
+    db_connection = providers.Singleton(
+        DbConnection,
+        config.DATABASE_URL,
+        pool_size=config.DATABASE_POOL_SIZE,
+        max_overflow=config.DATABASE_MAX_OVERFLOW,
+        pool_recycle=config.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=config.DATABASE_POOL_PRE_PING,
+        pool_timeout=config.DATABASE_POOL_TIMEOUT,
+        pool_warmup=config.DATABASE_POOL_WARMUP,
+        replica_urls=config.DATABASE_REPLICA_URLS,
+        replica_retry_interval=config.DATABASE_REPLICA_RETRY_INTERVAL,
+        replica_max_lag=config.DATABASE_REPLICA_MAX_LAG,
+        replica_health_check_interval=config.DATABASE_REPLICA_HEALTH_CHECK_INTERVAL,
+        read_your_writes=config.DATABASE_READ_YOUR_WRITES,
+    )
 
     property_repository = providers.Singleton(
-        PropertyRepositoryPostgres, db_connection=db_connection
+        PropertyRepositoryPostgres,
+        db_connection=db_connection,
+        trigram_search=config.SEARCH_TRIGRAM,
     )
 
     configuration_repository = providers.Singleton(
         ConfigurationRepositoryPostgres, db_connection=db_connection
     )
 
+    configuration_cache = providers.Singleton(
+        ConfigurationCache,
+        configuration_repository=configuration_repository,
+        ttl=config.CONFIGURATION_CACHE_TTL,
+    )
+
+    configuration_listener = providers.Singleton(
+        PostgresListener,
+        config.DATABASE_URL,
+        CONFIGURATION_CHANNEL,
+        callbacks=providers.List(configuration_cache.provided.invalidate),
+        health_check_interval=config.CONFIGURATION_LISTENER_HEALTH_CHECK_INTERVAL,
+    )
+
+    property_response_cache = providers.Selector(
+        config.RESPONSE_CACHE_BACKEND,
+        memory=providers.Singleton(
+            ResponseCache,
+            backend=providers.Singleton(
+                InMemoryCacheBackend,
+                max_size=config.RESPONSE_CACHE_MAX_SIZE,
+                ttl=config.RESPONSE_CACHE_TTL,
+            ),
+        ),
+        none=providers.Object(None),
+    )
+
+    property_listener = providers.Selector(
+        config.RESPONSE_CACHE_BACKEND,
+        memory=providers.Singleton(
+            PostgresListener,
+            config.DATABASE_URL,
+            PROPERTY_CHANNEL,
+            callbacks=providers.List(
+                property_response_cache.provided.invalidate_notified
+            ),
+            health_check_interval=config.CONFIGURATION_LISTENER_HEALTH_CHECK_INTERVAL,
+        ),
+        none=providers.Object(None),
+    )
+
+    property_single_flight = providers.Singleton(
+        SingleFlight, enabled=config.REQUEST_COALESCING
+    )
+
+    property_write_buffer = providers.Singleton(
+        GroupCommitBuffer,
+        repository=property_repository,
+        enabled=config.GROUP_COMMIT,
+        max_delay=config.GROUP_COMMIT_MAX_DELAY,
+        max_batch_size=config.GROUP_COMMIT_MAX_BATCH_SIZE,
+    )
+
     property_service = providers.Singleton(
         PropertyService,
         property_repository=property_repository,
-        configuration_repository=configuration_repository,
+        configuration_cache=configuration_cache,
+        response_cache=property_response_cache,
+        single_flight=property_single_flight,
+        write_buffer=property_write_buffer,
+    )
+
+    property_importer = providers.Singleton(
+        PropertyImporter,
+        property_repository=property_repository,
+        configuration_cache=configuration_cache,
+        response_cache=property_response_cache,
+        batch_size=config.IMPORT_BATCH_SIZE,
+        imports_dir=config.IMPORT_DIR,
     )
 
     configuration_service = providers.Singleton(
         ConfigurationService,
         configuration_repository=configuration_repository,
+        configuration_cache=configuration_cache,
     )
 
 
@@ -58,6 +173,8 @@ def create_container() -> Container:
             __name__,
             "property.presentation.property_api",
             "property.presentation.configuration_api",
+            "property.presentation.health_api",
+            "property.presentation.dependencies",
         ]
     )
     return container
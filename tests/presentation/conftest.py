@@ -3,6 +3,7 @@ import pytest_asyncio
 from httpx import ASGITransport
 from httpx import AsyncClient
 from factory.alchemy import SQLAlchemyModelFactory
+from sqlalchemy import text
 
 from property.domain.enums import ConfigurationType
 from property.infrastructure.postgres.tables import BaseTable
@@ -19,6 +20,7 @@ async def db_connection():
     db = container.db_connection()
     yield db
     await db.engine.dispose()
+    container.reset_singletons()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -29,8 +31,48 @@ async def async_client():
         yield client
 
 
+@pytest_asyncio.fixture(scope="function")
+async def fast_json():
+    with container.config.FAST_JSON_RESPONSES.override(True):
+        yield
+
+
+@pytest_asyncio.fixture(scope="function")
+async def response_cache(db_connection):
+    with container.config.RESPONSE_CACHE_BACKEND.override("memory"):
+        yield container.property_response_cache()
+
+
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def imports_dir(tmp_path):
+    with container.config.IMPORT_DIR.override(str(tmp_path)):
+        yield tmp_path
+
+
+@pytest_asyncio.fixture(scope="function")
+async def write_buffer(db_connection):
+    with container.config.GROUP_COMMIT.override(True):
+        yield container.property_write_buffer()
+
+
 @pytest_asyncio.fixture(scope="function", autouse=True)
-async def reset_db(db_connection: DbConnection):
+async def trigram_search(db_connection: DbConnection):
+    # The migrations create pg_trgm, fall back to plain search where it is missing.
+    async with db_connection.engine.begin() as conn:
+        available = await conn.scalar(
+            text(
+                "SELECT EXISTS (SELECT 1 FROM pg_available_extensions"
+                " WHERE name = 'pg_trgm')"
+            )
+        )
+        if available:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    with container.config.SEARCH_TRIGRAM.override(available):
+        yield available
+
+
+@pytest_asyncio.fixture(scope="function", autouse=True)
+async def reset_db(db_connection: DbConnection, trigram_search):
     async with db_connection.engine.begin() as conn:
         await conn.run_sync(BaseTable.metadata.drop_all)
         await conn.run_sync(BaseTable.metadata.create_all)
@@ -94,3 +136,30 @@ async def create_configuration(db_connection):
             value=["test1", "test2"],
         )
         yield configuration
+
+
+@pytest_asyncio.fixture
+async def create_properties(db_connection):
+    async with db_connection.get_session() as session:
+        PropertyFactory._meta.sqlalchemy_session = session
+        properties = []
+        for index in range(5):
+            properties.append(
+                await PropertyFactory.create_async(
+                    id=uuid4(),
+                    property_type="test",
+                    room_count=index + 1,
+                    bathroom_count=1,
+                    additional_features={
+                        "test": "test1" if index % 2 == 0 else "test2",
+                        "area": 50 * (index + 1),
+                    },
+                    location_address=f"test street {index}",
+                    location_latitude=1.0 + index * 0.01,
+                    location_longitude=1.0,
+                    rent_value=100.0 * (index + 1),
+                )
+            )
+        for property in properties:
+            await session.refresh(property)
+        yield properties
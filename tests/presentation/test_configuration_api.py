@@ -1,11 +1,17 @@
+import asyncio
 import pytest
+import pytest_asyncio
 from fastapi import status
 
 from uuid import uuid4
 from httpx import AsyncClient
 
+from property.application.cache import ConfigurationCache
+from property.application.dtos import ConfigurationUpdateRequest
 from property.domain.enums import ConfigurationType
 
+from main import container
+
 
 class TestConfigurationCreate:
     url = "/api/properties/settings/"
@@ -34,6 +40,11 @@ class TestConfigurationCreate:
         )
 
         assert response.status_code == status.HTTP_201_CREATED
+        etag = response.headers["ETag"]
+
+        response = await async_client.get(f"{self.url}{response.json()['id']}")
+
+        assert response.headers["ETag"] == etag
 
 
 class TestConfigurationGet:
@@ -70,10 +81,163 @@ class TestConfigurationList:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.json()) == 1
 
+    @pytest.mark.asyncio
+    async def test_list_configurations_cursor(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        response = await async_client.get(
+            self.url, params={"size": 1, "order_by": "key"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 1
+
+        response = await async_client.get(
+            self.url,
+            params={
+                "size": 1,
+                "order_by": "key",
+                "cursor": response.headers["X-Next-Cursor"],
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+
+class TestConfigurationListIdIn:
+    url = "/api/properties/settings/"
+
+    @pytest.mark.asyncio
+    async def test_list_configurations_id_in(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        response = await async_client.get(
+            self.url, params={"id_in": [str(create_configuration.id), str(uuid4())]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()] == [
+            str(create_configuration.id)
+        ]
+
+
+class TestConfigurationSparseFields:
+    url = "/api/properties/settings/"
+
+    @pytest.mark.asyncio
+    async def test_list_configurations_fields(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        response = await async_client.get(self.url, params={"fields": "key"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [{"id": str(create_configuration.id), "key": "test"}]
+
+
+class TestConfigurationListConditional:
+    url = "/api/properties/settings/"
+
+    @pytest.mark.asyncio
+    async def test_list_configurations_if_none_match(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        response = await async_client.get(self.url)
+        etag = response.headers["ETag"]
+
+        response = await async_client.get(self.url, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        await async_client.post(
+            self.url, json={"key": "new", "type": ConfigurationType.NUMBER.value}
+        )
+        response = await async_client.get(self.url, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 2
+
+    @pytest.mark.asyncio
+    async def test_list_configurations_etag_changes_on_delete_in_page(
+        self, async_client: AsyncClient
+    ):
+        for key in ("a", "b", "c"):
+            await async_client.post(
+                self.url, json={"key": key, "type": ConfigurationType.NUMBER.value}
+            )
+        params = {"size": 2}
+        response = await async_client.get(self.url, params=params)
+        etag = response.headers["ETag"]
+        assert "Last-Modified" not in response.headers
+
+        # The next row shifts in, count and newest timestamp may stay the same.
+        await async_client.delete(f"{self.url}{response.json()[0]['id']}")
+        response = await async_client.get(
+            self.url, params=params, headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+
+    @pytest.mark.asyncio
+    async def test_list_configurations_ignores_if_modified_since(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        response = await async_client.get(
+            self.url, headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.asyncio
+    async def test_list_configurations_not_modified_reads_keys_only(
+        self, async_client: AsyncClient, create_configuration, monkeypatch
+    ):
+        repository = container.configuration_repository()
+        list_rows = repository.list_rows
+        fields = []
+
+        async def record(filters, *args, **kwargs):
+            fields.append(filters.fields)
+            return await list_rows(filters, *args, **kwargs)
+
+        monkeypatch.setattr(repository, "list_rows", record)
+        response = await async_client.get(self.url)
+        etag = response.headers["ETag"]
+        fields.clear()
+
+        response = await async_client.get(self.url, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert fields == [["id"]]
+
 
 class TestConfigurationUpdate:
     url = "/api/properties/settings/{configuration_id}"
 
+    @pytest.mark.asyncio
+    async def test_update_configuration_if_match(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        url = self.url.format(configuration_id=create_configuration.id)
+        response = await async_client.get(url)
+        etag = response.headers["ETag"]
+
+        response = await async_client.put(
+            url, json={"value": ["test3"]}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        updated_etag = response.headers["ETag"]
+        assert updated_etag != etag
+        assert (await async_client.get(url)).headers["ETag"] == updated_etag
+
+        response = await async_client.put(
+            url, json={"value": ["test4"]}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
     @pytest.mark.asyncio
     async def test_update_configuration_success(
         self, async_client: AsyncClient, create_configuration
@@ -154,3 +318,73 @@ class TestConfigurationDelete:
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestConfigurationNotifications:
+    url = "/api/properties/settings/"
+
+    @pytest_asyncio.fixture
+    async def listener(self):
+        listener = container.configuration_listener()
+        await listener.start()
+        await asyncio.wait_for(listener.listening.wait(), timeout=5)
+        yield listener
+        await listener.stop()
+
+    @pytest.mark.asyncio
+    async def test_configuration_write_invalidates_other_workers(
+        self, async_client: AsyncClient, listener, create_configuration
+    ):
+        other_worker_cache = ConfigurationCache(
+            container.configuration_repository(), ttl=3600
+        )
+        listener.subscribe(other_worker_cache.invalidate)
+        assert create_configuration.key in await other_worker_cache.get_all()
+
+        response = await async_client.post(
+            self.url,
+            json={"key": "new", "type": ConfigurationType.NUMBER.value},
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        for _ in range(50):
+            if other_worker_cache._configurations is None:
+                break
+            await asyncio.sleep(0.05)
+
+        assert "new" in await other_worker_cache.get_all()
+
+
+class TestConfigurationCacheAfterCommit:
+    @pytest.mark.asyncio
+    async def test_cache_invalidated_after_commit(
+        self, db_connection, create_configuration
+    ):
+        service = container.configuration_service()
+        cache = container.configuration_cache()
+        assert await cache.get_all()
+
+        async with db_connection.unit_of_work():
+            await service.update_configuration(
+                create_configuration.id, ConfigurationUpdateRequest(value=["test3"])
+            )
+            # A reload here would still read the committed configuration.
+            assert cache._is_fresh()
+
+        assert not cache._is_fresh()
+        configurations = await cache.get_all()
+        assert configurations[create_configuration.key].value == ["test3"]
+
+    @pytest.mark.asyncio
+    async def test_cache_kept_on_rollback(self, db_connection, create_configuration):
+        service = container.configuration_service()
+        cache = container.configuration_cache()
+        assert await cache.get_all()
+
+        with pytest.raises(RuntimeError):
+            async with db_connection.unit_of_work():
+                await service.delete_configuration(create_configuration.id)
+                raise RuntimeError()
+
+        assert cache._is_fresh()
+        assert create_configuration.key in await cache.get_all()
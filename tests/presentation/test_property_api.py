@@ -1,8 +1,31 @@
+import asyncio
+import contextvars
+import csv
+import io
+import json
 import pytest
+import pytest_asyncio
 from fastapi import status
 
 from uuid import uuid4
 from httpx import AsyncClient
+from sqlalchemy import event
+
+from property.application.coalescing import SingleFlight
+from property.application.dtos import PropertyUpdateRequest
+from property.application.group_commit import GroupCommitBuffer
+from property.application.importers import PropertyImporter
+from property.application.response_cache import InMemoryCacheBackend
+from property.application.response_cache import ResponseCache
+from property.domain.exceptions import PropertyNotFoundError
+from property.domain.exceptions import RecordNotWrittenError
+from property.domain.filters import PropertyFilter
+from property.domain.models import Location
+from property.domain.models import Property
+from property.infrastructure.postgres.database import DbConnection
+from property.infrastructure.postgres.repositories import PropertyRepositoryPostgres
+
+from main import container
 
 
 class TestPropertyCreate:
@@ -96,6 +119,119 @@ class TestPropertyCreate:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    @pytest.mark.asyncio
+    async def test_create_returns_server_timestamps(self, db_connection):
+        repository = PropertyRepositoryPostgres(db_connection)
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db_connection.engine.sync_engine, "before_cursor_execute", record)
+        try:
+            created = await repository.create(
+                Property(
+                    property_type="test",
+                    room_count=1,
+                    bathroom_count=1,
+                    additional_features={},
+                    location=Location(address="test"),
+                    rent_value=1,
+                )
+            )
+        finally:
+            event.remove(
+                db_connection.engine.sync_engine, "before_cursor_execute", record
+            )
+
+        # The timestamps come back with the INSERT, the row is not read again.
+        assert created.created_at is not None
+        assert created.updated_at is not None
+        assert not any(" FROM property" in statement for statement in statements)
+        stored = await repository.list(PropertyFilter(id_eq=created.id))
+        assert stored[0].created_at == created.created_at
+        assert stored[0].updated_at == created.updated_at
+
+
+class TestPropertyBulkCreate:
+    url = "/api/properties/bulk"
+
+    @pytest.mark.asyncio
+    async def test_create_properties_partial_success(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        item = {
+            "property_type": create_configuration.key,
+            "room_count": 1,
+            "bathroom_count": 1,
+            "additional_features": {"test": "test1"},
+            "location": {
+                "latitude": 1.0,
+                "longitude": 1.0,
+                "address": "test",
+            },
+            "rent_value": 1.0,
+        }
+        response = await async_client.post(
+            self.url,
+            json=[
+                item,
+                {**item, "property_type": "not_valid"},
+                {**item, "room_count": 3},
+            ],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["room_count"] for p in response.json()["created"]] == [1, 3]
+        assert response.json()["errors"] == [
+            {
+                "index": 1,
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "message": "Property type 'not_valid' is not valid",
+            }
+        ]
+
+        response = await async_client.get("/api/properties/")
+
+        assert len(response.json()) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_properties_database_failure(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        item = {
+            "property_type": create_configuration.key,
+            "room_count": 1,
+            "bathroom_count": 1,
+            "additional_features": {"test": "test1"},
+            "location": {
+                "latitude": 1.0,
+                "longitude": 1.0,
+                "address": "test",
+            },
+            "rent_value": 1.0,
+        }
+        response = await async_client.post(
+            self.url,
+            json=[
+                item,
+                {**item, "room_count": 2**40},
+                {**item, "property_type": "not_valid"},
+                {**item, "room_count": 3},
+            ],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [p["room_count"] for p in response.json()["created"]] == [1, 3]
+        errors = response.json()["errors"]
+        assert [error["index"] for error in errors] == [1, 2]
+        assert errors[0]["status_code"] == status.HTTP_400_BAD_REQUEST
+        assert errors[0]["message"].startswith("Record could not be written")
+
+        response = await async_client.get("/api/properties/")
+
+        assert len(response.json()) == 2
+
 
 class TestPropertyGet:
     url = "/api/properties/{property_id}"
@@ -119,6 +255,162 @@ class TestPropertyGet:
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+class TestPropertySparseFields:
+    url = "/api/properties/"
+
+    @pytest.mark.asyncio
+    async def test_list_properties_fields(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(
+            self.url,
+            params={"fields": "location,rent_value", "order_by": "rent_value"},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()[0] == {
+            "id": str(create_properties[0].id),
+            "location": {"address": "test street 0", "latitude": 1.0, "longitude": 1.0},
+            "rent_value": 100.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_list_properties_fields_fast_json(
+        self, async_client: AsyncClient, create_properties, fast_json
+    ):
+        response = await async_client.get(
+            self.url, params=[("fields", "room_count"), ("fields", "id")]
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(set(item) == {"id", "room_count"} for item in response.json())
+
+    @pytest.mark.asyncio
+    async def test_get_property_fields(
+        self, async_client: AsyncClient, create_property
+    ):
+        response = await async_client.get(
+            f"{self.url}{create_property.id}", params={"fields": "property_type"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "id": str(create_property.id),
+            "property_type": "test",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_property_fields_not_valid(
+        self, async_client: AsyncClient, create_property
+    ):
+        response = await async_client.get(
+            f"{self.url}{create_property.id}", params={"fields": "location_cell"}
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+class TestPropertyBatchGet:
+    url = "/api/properties/batch-get"
+
+    @pytest.mark.asyncio
+    async def test_batch_get_properties_preserves_order(
+        self, async_client: AsyncClient, create_properties
+    ):
+        missing_id = str(uuid4())
+        ids = [
+            str(create_properties[3].id),
+            missing_id,
+            str(create_properties[0].id),
+            str(create_properties[3].id),
+        ]
+
+        response = await async_client.post(self.url, json={"ids": ids})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()["items"]] == [ids[0], ids[2]]
+        assert response.json()["missing"] == [missing_id]
+
+    @pytest.mark.asyncio
+    async def test_batch_get_properties_empty(self, async_client: AsyncClient):
+        response = await async_client.post(self.url, json={"ids": []})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+class TestPropertyConditional:
+    url = "/api/properties/{property_id}"
+
+    @pytest.mark.asyncio
+    async def test_get_property_if_none_match(
+        self, async_client: AsyncClient, create_property
+    ):
+        url = self.url.format(property_id=create_property.id)
+        response = await async_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "Last-Modified" in response.headers
+        etag = response.headers["ETag"]
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    @pytest.mark.asyncio
+    async def test_get_property_if_modified_since(
+        self, async_client: AsyncClient, create_property
+    ):
+        url = self.url.format(property_id=create_property.id)
+        response = await async_client.get(url)
+        last_modified = response.headers["Last-Modified"]
+
+        response = await async_client.get(
+            url, headers={"If-Modified-Since": last_modified}
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        response = await async_client.get(
+            url, headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+    @pytest.mark.asyncio
+    async def test_update_property_if_match(
+        self, async_client: AsyncClient, create_property, create_configuration
+    ):
+        url = self.url.format(property_id=create_property.id)
+        etag = (await async_client.get(url)).headers["ETag"]
+
+        response = await async_client.put(
+            url, json={"room_count": 2}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["ETag"] != etag
+        assert (await async_client.get(url)).headers["ETag"] == response.headers["ETag"]
+
+        response = await async_client.put(
+            url, json={"room_count": 3}, headers={"If-Match": etag}
+        )
+
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert (await async_client.get(url)).json()["room_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_update_property_if_match_not_found(self, async_client: AsyncClient):
+        response = await async_client.put(
+            self.url.format(property_id=uuid4()),
+            json={"room_count": 2},
+            headers={"If-Match": '"1-0"'},
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestPropertyList:
     url = "/api/properties/"
 
@@ -132,6 +424,530 @@ class TestPropertyList:
         assert len(response.json()) == 1
 
 
+class TestPropertyListFilter:
+    url = "/api/properties/"
+
+    @pytest.mark.asyncio
+    async def test_list_properties_rent_value_range(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(
+            self.url, params={"rent_value_gte": 200, "rent_value_lte": 400}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(item["rent_value"] for item in response.json()) == [
+            200.0,
+            300.0,
+            400.0,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_property_type_in_and_room_count(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(
+            self.url,
+            params=[
+                ("property_type_in", "test"),
+                ("property_type_in", "other"),
+                ("room_count_gte", 4),
+            ],
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(item["room_count"] for item in response.json()) == [4, 5]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_property_type_eq(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(
+            self.url, params={"property_type_eq": "other"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+
+class TestPropertyListFeatureFilter:
+    url = "/api/properties/"
+
+    @pytest.mark.asyncio
+    async def test_list_properties_feature_eq(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(
+            self.url, params={"feature_eq": ["test:test2", "area:100"]}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["room_count"] for item in response.json()] == [2]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_feature_exists(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(self.url, params={"feature_exists": "pool"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_list_properties_feature_range(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(
+            self.url, params={"feature_gte": "area:100", "feature_lte": "area:150"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(item["room_count"] for item in response.json()) == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_feature_not_valid(self, async_client: AsyncClient):
+        response = await async_client.get(self.url, params={"feature_gte": "area"})
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+class TestPropertyListLocationFilter:
+    url = "/api/properties/"
+
+    @pytest.mark.asyncio
+    async def test_list_properties_near_antimeridian(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        for room_count, longitude in ((1, -179.95), (2, 179.0)):
+            response = await async_client.post(
+                self.url,
+                json={
+                    "property_type": create_configuration.key,
+                    "room_count": room_count,
+                    "bathroom_count": 1,
+                    "additional_features": {"test": "test1"},
+                    "location": {
+                        "latitude": 0.0,
+                        "longitude": longitude,
+                        "address": "test",
+                    },
+                    "rent_value": 1.0,
+                },
+            )
+            assert response.status_code == status.HTTP_201_CREATED
+
+        # About 7 km away, on the other side of the antimeridian.
+        response = await async_client.get(
+            self.url, params={"near_lat": 0.0, "near_lon": 179.99, "radius_km": 20}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["room_count"] for item in response.json()] == [1]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_near(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(
+            self.url, params={"near_lat": 1.04, "near_lon": 1.0, "radius_km": 2.5}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["room_count"] for item in response.json()] == [5, 4, 3]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_bounding_box(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(
+            self.url,
+            params={
+                "min_lat": 1.005,
+                "max_lat": 1.025,
+                "min_lon": 0.9,
+                "max_lon": 1.1,
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert sorted(item["room_count"] for item in response.json()) == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_near_incomplete(self, async_client: AsyncClient):
+        response = await async_client.get(
+            self.url, params={"near_lat": 1.0, "near_lon": 1.0}
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_CONTENT
+
+
+class TestPropertyFastJson:
+    url = "/api/properties/"
+
+    @pytest.mark.asyncio
+    async def test_list_properties_fast_json(
+        self, async_client: AsyncClient, create_properties, fast_json
+    ):
+        response = await async_client.get(
+            self.url, params={"size": 2, "order_by": "rent_value"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert "X-Next-Cursor" in response.headers
+        assert response.json()[0] == {
+            "id": str(create_properties[0].id),
+            "property_type": "test",
+            "room_count": 1,
+            "bathroom_count": 1,
+            "additional_features": {"test": "test1", "area": 50},
+            "location": {
+                "address": "test street 0",
+                "latitude": 1.0,
+                "longitude": 1.0,
+            },
+            "rent_value": 100.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_create_property_fast_json(
+        self, async_client: AsyncClient, create_configuration, fast_json
+    ):
+        response = await async_client.post(
+            self.url,
+            json={
+                "property_type": create_configuration.key,
+                "room_count": 1,
+                "bathroom_count": 1,
+                "additional_features": {"test": "test1"},
+                "location": {"address": "test"},
+                "rent_value": 10,
+            },
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["rent_value"] == 10.0
+
+
+class TestPropertyListSearch:
+    url = "/api/properties/"
+
+    @pytest.mark.asyncio
+    async def test_list_properties_search_prefix(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(self.url, params={"q": "stre 3"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["location"]["address"] for item in response.json()] == [
+            "test street 3"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_search_substring(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(self.url, params={"q": "reet"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 5
+
+    @pytest.mark.asyncio
+    async def test_list_properties_search_no_match(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(self.url, params={"q": "100%"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    @pytest.mark.asyncio
+    async def test_list_properties_search_misspelt(
+        self, async_client: AsyncClient, create_properties, trigram_search
+    ):
+        if not trigram_search:
+            pytest.skip("pg_trgm is not available")
+        response = await async_client.get(self.url, params={"q": "stret"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 5
+
+
+class TestPropertyListCursor:
+    url = "/api/properties/"
+
+    @pytest.mark.asyncio
+    async def test_list_properties_cursor_pages(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(self.url, params={"size": 3})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 3
+        cursor = response.headers["X-Next-Cursor"]
+
+        next_response = await async_client.get(
+            self.url, params={"size": 3, "cursor": cursor}
+        )
+
+        assert next_response.status_code == status.HTTP_200_OK
+        assert len(next_response.json()) == 2
+        assert "X-Next-Cursor" not in next_response.headers
+        ids = {item["id"] for item in response.json() + next_response.json()}
+        assert ids == {str(item.id) for item in create_properties}
+
+    @pytest.mark.asyncio
+    async def test_list_properties_cursor_ordered(
+        self, async_client: AsyncClient, create_properties
+    ):
+        params = {"size": 2, "order_by": "-rent_value"}
+        rents = []
+        while True:
+            response = await async_client.get(self.url, params=params)
+            assert response.status_code == status.HTTP_200_OK
+            rents.extend(item["rent_value"] for item in response.json())
+            if "X-Next-Cursor" not in response.headers:
+                break
+            params["cursor"] = response.headers["X-Next-Cursor"]
+
+        assert rents == [500.0, 400.0, 300.0, 200.0, 100.0]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_no_cursor_for_json_column(
+        self, async_client: AsyncClient, create_properties
+    ):
+        params = {"size": 1, "order_by": "additional_features"}
+        response = await async_client.get(self.url, params=params)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 1
+        assert "X-Next-Cursor" not in response.headers
+
+    @pytest.mark.asyncio
+    async def test_list_properties_cursor_unselected_column(
+        self, async_client: AsyncClient, create_properties
+    ):
+        params = {"size": 2, "order_by": "created_at"}
+        ids = []
+        while True:
+            response = await async_client.get(self.url, params=params)
+            assert response.status_code == status.HTTP_200_OK
+            assert all("created_at" not in item for item in response.json())
+            ids.extend(item["id"] for item in response.json())
+            if "X-Next-Cursor" not in response.headers:
+                break
+            params["cursor"] = response.headers["X-Next-Cursor"]
+
+        assert sorted(ids) == sorted(str(item.id) for item in create_properties)
+
+    @pytest.mark.asyncio
+    async def test_list_properties_cursor_not_valid(self, async_client: AsyncClient):
+        response = await async_client.get(
+            self.url, params={"size": 2, "cursor": "not_valid"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestPropertyExport:
+    url = "/api/properties/export"
+
+    @pytest.mark.asyncio
+    async def test_export_properties_ndjson(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(self.url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert {line["id"] for line in lines} == {
+            str(item.id) for item in create_properties
+        }
+
+    @pytest.mark.asyncio
+    async def test_export_properties_csv(
+        self, async_client: AsyncClient, create_properties
+    ):
+        response = await async_client.get(
+            self.url, params={"format": "csv", "order_by": "rent_value"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert len(rows) == 5
+        assert rows[0]["rent_value"] == "100.0"
+        assert json.loads(rows[0]["additional_features"]) == {
+            "test": "test1",
+            "area": 50,
+        }
+
+
+class TestPropertyImport:
+    url = "/api/properties/imports"
+
+    @pytest.mark.asyncio
+    async def test_import_properties_ndjson(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        item = {
+            "property_type": create_configuration.key,
+            "room_count": 1,
+            "bathroom_count": 1,
+            "additional_features": {"test": "test1"},
+            "location": {"address": "test"},
+            "rent_value": 1.0,
+        }
+        content = "\n".join(
+            [
+                json.dumps(item),
+                json.dumps({**item, "additional_features": {"test": "not_valid"}}),
+                "{not json",
+                json.dumps({**item, "room_count": 2}),
+            ]
+        )
+
+        response = await async_client.post(
+            self.url,
+            params={"format": "ndjson"},
+            content=content.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        report = response.json()
+        assert report["status"] == "completed"
+        assert report["processed"] == 4
+        assert report["created"] == 2
+        assert report["failed"] == 2
+
+        response = await async_client.get(f"{self.url}/{report['id']}/errors")
+
+        assert response.status_code == status.HTTP_200_OK
+        errors = [json.loads(line) for line in response.text.splitlines()]
+        assert [error["line"] for error in errors] == [2, 3]
+        assert report["errors_url"].endswith(f"{self.url}/{report['id']}/errors")
+
+    @pytest.mark.asyncio
+    async def test_import_properties_database_failure(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        item = {
+            "property_type": create_configuration.key,
+            "room_count": 1,
+            "bathroom_count": 1,
+            "additional_features": {"test": "test1"},
+            "location": {"address": "test"},
+            "rent_value": 1.0,
+        }
+        content = "\n".join(
+            [
+                json.dumps(item),
+                json.dumps({**item, "room_count": 2}),
+                json.dumps({**item, "room_count": 2**40}),
+                json.dumps({**item, "room_count": 4}),
+            ]
+        )
+
+        response = await async_client.post(
+            self.url,
+            params={"format": "ndjson"},
+            content=content.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        report = response.json()
+        assert report["created"] == 3
+        assert report["failed"] == 1
+
+        response = await async_client.get(report["errors_url"])
+
+        errors = [json.loads(line) for line in response.text.splitlines()]
+        assert [error["line"] for error in errors] == [3]
+
+        response = await async_client.get("/api/properties/")
+
+        assert sorted(p["room_count"] for p in response.json()) == [1, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_import_properties_csv(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        content = (
+            "property_type,room_count,bathroom_count,rent_value,location_address,"
+            "location_latitude,location_longitude,additional_features\r\n"
+            f'{create_configuration.key},1,1,10.5,"first line\nsecond line",1.0,,'
+            '"{""test"": ""test1""}"\r\n'
+            f"{create_configuration.key},x,1,10.5,address,,,\r\n"
+        )
+
+        response = await async_client.post(
+            self.url,
+            params={"format": "csv"},
+            content=content.encode(),
+            headers={"Content-Type": "text/csv"},
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.json()["created"] == 1
+        assert response.json()["failed"] == 1
+
+        response = await async_client.get("/api/properties/")
+
+        assert response.json()[0]["location"]["address"] == "first line\nsecond line"
+
+    @pytest.mark.asyncio
+    async def test_import_visible_to_other_workers(
+        self, async_client: AsyncClient, create_configuration, imports_dir
+    ):
+        response = await async_client.post(
+            self.url,
+            params={"format": "ndjson"},
+            content=b"{not json",
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+        report = response.json()
+
+        other_worker = PropertyImporter(
+            container.property_repository(),
+            container.configuration_cache(),
+            imports_dir=str(imports_dir),
+        )
+
+        assert other_worker.get_import(report["id"]).failed == 1
+        assert other_worker.get_import_errors(report["id"]) is not None
+
+    @pytest.mark.asyncio
+    async def test_evicted_import_files_are_deleted(
+        self, async_client: AsyncClient, create_configuration, imports_dir
+    ):
+        container.property_importer().max_imports = 1
+        ids = []
+        for _ in range(2):
+            response = await async_client.post(
+                self.url,
+                params={"format": "ndjson"},
+                content=b"{not json",
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            ids.append(response.json()["id"])
+
+        response = await async_client.get(f"{self.url}/{ids[0]}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert sorted(path.name for path in imports_dir.iterdir()) == [
+            f"import-{ids[1]}-errors.ndjson",
+            f"import-{ids[1]}.json",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_get_import_not_found(self, async_client: AsyncClient):
+        response = await async_client.get(f"{self.url}/{uuid4()}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
 class TestPropertyUpdate:
     url = "/api/properties/{property_id}"
 
@@ -151,6 +967,43 @@ class TestPropertyUpdate:
         assert response.json()["room_count"] == 2
         assert response.json()["bathroom_count"] == 2
 
+    @pytest.mark.asyncio
+    async def test_update_property_location(
+        self, async_client: AsyncClient, create_property, create_configuration
+    ):
+        response = await async_client.put(
+            self.url.format(property_id=create_property.id),
+            json={"location": {"address": "new street", "latitude": 2.0}},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["location"] == {
+            "address": "new street",
+            "latitude": 2.0,
+            "longitude": None,
+        }
+        response = await async_client.get(
+            self.url.format(property_id=create_property.id)
+        )
+        assert response.json()["location"]["address"] == "new street"
+
+    @pytest.mark.asyncio
+    async def test_update_property_single_connection(
+        self,
+        async_client: AsyncClient,
+        db_connection,
+        create_property,
+        create_configuration,
+    ):
+        before = db_connection.pool_stats().acquisitions
+        response = await async_client.put(
+            self.url.format(property_id=create_property.id),
+            json={"property_type": "test", "additional_features": {"test": "test2"}},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert db_connection.pool_stats().acquisitions == before + 1
+
     @pytest.mark.asyncio
     async def test_update_property_not_found(self, async_client: AsyncClient):
         response = await async_client.put(
@@ -176,6 +1029,19 @@ class TestPropertyUpdate:
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+    @pytest.mark.asyncio
+    async def test_update_property_not_valid_additional_features_value(
+        self, async_client: AsyncClient, create_property, create_configuration
+    ):
+        response = await async_client.put(
+            self.url.format(property_id=create_property.id),
+            json={
+                "additional_features": {"test": "not_valid"},
+            },
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
 
 class TestPropertyDelete:
     url = "/api/properties/{property_id}"
@@ -196,6 +1062,21 @@ class TestPropertyDelete:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
+    @pytest.mark.asyncio
+    async def test_delete_property_rolled_back_on_error(
+        self, async_client: AsyncClient, db_connection, create_property
+    ):
+        repository = PropertyRepositoryPostgres(db_connection)
+        with pytest.raises(RuntimeError):
+            async with db_connection.unit_of_work():
+                assert await repository.delete(create_property.id) is not None
+                raise RuntimeError()
+
+        response = await async_client.get(
+            self.url.format(property_id=create_property.id)
+        )
+        assert response.status_code == status.HTTP_200_OK
+
     @pytest.mark.asyncio
     async def test_delete_property_not_found(self, async_client: AsyncClient):
         response = await async_client.delete(
@@ -203,3 +1084,334 @@ class TestPropertyDelete:
         )
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_delete_property_twice_in_unit_of_work(
+        self, async_client: AsyncClient, db_connection, create_property
+    ):
+        service = container.property_service()
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        async with db_connection.unit_of_work():
+            await service.delete_property(create_property.id)
+            event.listen(
+                db_connection.engine.sync_engine, "before_cursor_execute", record
+            )
+            try:
+                with pytest.raises(PropertyNotFoundError):
+                    await service.delete_property(create_property.id)
+            finally:
+                event.remove(
+                    db_connection.engine.sync_engine, "before_cursor_execute", record
+                )
+
+        # The 404 comes from the empty RETURNING, no lookup is made first.
+        assert len(statements) == 1
+        assert statements[0].startswith("DELETE FROM property")
+        assert "RETURNING" in statements[0]
+
+        response = await async_client.get(
+            self.url.format(property_id=create_property.id)
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+class TestPropertyConfigurationCache:
+    url = "/api/properties/"
+    configuration_url = "/api/properties/settings/{configuration_id}"
+
+    @pytest.mark.asyncio
+    async def test_create_property_after_configuration_update(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        payload = {
+            "property_type": create_configuration.key,
+            "room_count": 1,
+            "bathroom_count": 1,
+            "additional_features": {"test": "test1"},
+            "location": {
+                "latitude": 1.0,
+                "longitude": 1.0,
+                "address": "test",
+            },
+            "rent_value": 1.0,
+        }
+        response = await async_client.post(self.url, json=payload)
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+        response = await async_client.put(
+            self.configuration_url.format(configuration_id=create_configuration.id),
+            json={"value": ["test2"]},
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+
+        response = await async_client.post(self.url, json=payload)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+class TestPropertyResponseCache:
+    url = "/api/properties/"
+    cache_url = "/api/health/cache"
+
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self, async_client: AsyncClient):
+        response = await async_client.get(self.cache_url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_get_property_is_cached_until_update(
+        self, async_client: AsyncClient, response_cache, create_property
+    ):
+        url = f"{self.url}{create_property.id}"
+        first = await async_client.get(url)
+        second = await async_client.get(url)
+
+        assert second.json() == first.json()
+        assert second.headers["ETag"] == first.headers["ETag"]
+        stats = (await async_client.get(self.cache_url)).json()
+        assert stats["enabled"] is True
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+        response = await async_client.put(url, json={"room_count": 2})
+
+        assert response.status_code == status.HTTP_200_OK
+        response = await async_client.get(url)
+        assert response.json()["room_count"] == 2
+        assert response.headers["ETag"] != first.headers["ETag"]
+
+    @pytest.mark.asyncio
+    async def test_list_properties_is_cached_until_delete(
+        self, async_client: AsyncClient, response_cache, create_properties
+    ):
+        params = {"room_count_gte": 2}
+        first = await async_client.get(self.url, params=params)
+        await async_client.get(self.url, params=params)
+
+        assert response_cache.stats().hits == 1
+
+        property_id = first.json()[0]["id"]
+        response = await async_client.delete(f"{self.url}{property_id}")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        response = await async_client.get(self.url, params=params)
+        assert len(response.json()) == len(first.json()) - 1
+        assert response_cache.stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_read_before_commit_is_not_kept(
+        self, db_connection: DbConnection, response_cache, create_property
+    ):
+        service = container.property_service()
+
+        async with db_connection.unit_of_work():
+            await service.update_property(
+                create_property.id, PropertyUpdateRequest(room_count=2)
+            )
+            # Another request reads and caches the row before the write commits.
+            read = asyncio.get_running_loop().create_task(
+                service.get_property_by_id(create_property.id),
+                context=contextvars.Context(),
+            )
+            output, _ = await read
+            assert output.room_count == create_property.room_count
+
+        output, _ = await service.get_property_by_id(create_property.id)
+        assert output.room_count == 2
+
+    @pytest_asyncio.fixture
+    async def listener(self, response_cache):
+        listener = container.property_listener()
+        await listener.start()
+        await asyncio.wait_for(listener.listening.wait(), timeout=5)
+        yield listener
+        await listener.stop()
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_other_workers(
+        self, async_client: AsyncClient, listener, create_property
+    ):
+        other_worker_cache = ResponseCache(InMemoryCacheBackend())
+        listener.subscribe(other_worker_cache.invalidate_notified)
+
+        async def load():
+            return "cached"
+
+        await other_worker_cache.get_item(create_property.id, load)
+        assert other_worker_cache.stats().size == 1
+
+        response = await async_client.put(
+            f"{self.url}{create_property.id}", json={"room_count": 2}
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        for _ in range(50):
+            if other_worker_cache.stats().size == 0:
+                break
+            await asyncio.sleep(0.05)
+
+        assert other_worker_cache.stats().size == 0
+
+
+class TestPropertyCoalescing:
+    url = "/api/properties/{property_id}"
+    coalescing_url = "/api/health/coalescing"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_are_coalesced(
+        self, async_client: AsyncClient, create_property
+    ):
+        url = self.url.format(property_id=create_property.id)
+        responses = await asyncio.gather(*(async_client.get(url) for _ in range(10)))
+
+        assert {response.status_code for response in responses} == {status.HTTP_200_OK}
+        assert len({response.content for response in responses}) == 1
+        stats = (await async_client.get(self.coalescing_url)).json()
+        # An unconditional GET reads the row only, its validators come with it.
+        assert stats["executed"] + stats["coalesced"] == 10
+        assert stats["coalesced"] > 0
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_single_flight_shares_result_and_errors(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            if calls == 2:
+                raise ValueError("failed")
+            return calls
+
+        tasks = [asyncio.create_task(single_flight.do("key", load)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [1, 1, 1]
+
+        release.clear()
+        tasks = [asyncio.create_task(single_flight.do("key", load)) for _ in range(2)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert single_flight.stats().executed == 2
+        assert single_flight.stats().coalesced == 3
+
+
+class TestPropertyGroupCommit:
+    url = "/api/properties/"
+    group_commit_url = "/api/health/group-commit"
+
+    def build_payload(self, key: str, room_count: int) -> dict:
+        return {
+            "property_type": key,
+            "room_count": room_count,
+            "bathroom_count": 1,
+            "additional_features": {"test": "test1"},
+            "location": {"latitude": 1.0, "longitude": 1.0, "address": "test"},
+            "rent_value": 1.0,
+        }
+
+    @pytest.mark.asyncio
+    async def test_concurrent_creates_share_one_commit(
+        self, async_client: AsyncClient, write_buffer, create_configuration
+    ):
+        payloads = [
+            self.build_payload(create_configuration.key, index + 1)
+            for index in range(5)
+        ]
+        payloads.append(self.build_payload("unknown", 1))
+        responses = await asyncio.gather(
+            *(async_client.post(self.url, json=payload) for payload in payloads)
+        )
+
+        assert [response.status_code for response in responses] == [
+            status.HTTP_201_CREATED
+        ] * 5 + [status.HTTP_400_BAD_REQUEST]
+        assert [response.json()["room_count"] for response in responses[:5]] == [
+            1,
+            2,
+            3,
+            4,
+            5,
+        ]
+        stats = (await async_client.get(self.group_commit_url)).json()
+        assert stats["writes"] == 5
+        assert stats["batches"] < 5
+        assert stats["pending"] == 0
+
+        response = await async_client.get(self.url)
+        assert len(response.json()) == 5
+
+    @pytest.mark.asyncio
+    async def test_database_failure_is_bad_request(
+        self, async_client: AsyncClient, write_buffer, create_configuration
+    ):
+        payloads = [
+            self.build_payload(create_configuration.key, 1),
+            self.build_payload(create_configuration.key, 2**40),
+        ]
+        responses = await asyncio.gather(
+            *(async_client.post(self.url, json=payload) for payload in payloads)
+        )
+
+        assert [response.status_code for response in responses] == [
+            status.HTTP_201_CREATED,
+            status.HTTP_400_BAD_REQUEST,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_database_failure_is_bad_request_unbuffered(
+        self, async_client: AsyncClient, create_configuration
+    ):
+        response = await async_client.post(
+            self.url, json=self.build_payload(create_configuration.key, 2**40)
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_single_rows(
+        self, db_connection: DbConnection
+    ):
+        # The batch is flushed by size, the out of range room count breaks it.
+        write_buffer = GroupCommitBuffer(
+            PropertyRepositoryPostgres(db_connection),
+            enabled=True,
+            max_delay=1,
+            max_batch_size=2,
+        )
+
+        def build(room_count: int) -> Property:
+            return Property(
+                property_type="test",
+                room_count=room_count,
+                bathroom_count=1,
+                additional_features={},
+                location=Location(address="group street"),
+                rent_value=100,
+            )
+
+        results = await asyncio.gather(
+            write_buffer.create(build(1)),
+            write_buffer.create(build(2**40)),
+            return_exceptions=True,
+        )
+
+        assert results[0].room_count == 1
+        assert isinstance(results[1], RecordNotWrittenError)
+        assert write_buffer.stats().fallbacks == 1
+        await write_buffer.close()